@@ -0,0 +1,55 @@
+"""add computed_sum to pricing_pricingstrategy
+
+Revision ID: 4844bc6a8a1e
+Revises: 914f191a913d
+Create Date: 2026-10-16 09:07:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "4844bc6a8a1e"
+down_revision: Union[str, None] = "914f191a913d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+PRICING_SUM_SQL = (
+    "round(("
+    "coalesce((parameters #>> '{parameters,pricePerMeter}')::numeric, 0)"
+    " * ((coalesce((parameters #>> '{parameters,marginPct}')::numeric, 0)"
+    " + 100) / 100)"
+    " + coalesce("
+    "(parameters #>> '{parameters,extras,ottomanFlat,count}')::numeric, 0)"
+    " * coalesce("
+    "(parameters #>> '{parameters,extras,ottomanFlat,price}')::numeric, 0)"
+    " + coalesce("
+    "(parameters #>> '{parameters,extras,mechanismFlat,count}')::numeric, 0)"
+    " * coalesce("
+    "(parameters #>> '{parameters,extras,mechanismFlat,price}')::numeric, 0)"
+    ") * ((coalesce("
+    "(parameters #>> '{parameters,fabricPct,category}')::numeric, 0)"
+    " + 100) / 100), 2)"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "pricing_pricingstrategy",
+        sa.Column(
+            "computed_sum",
+            sa.Numeric(12, 2),
+            sa.Computed(PRICING_SUM_SQL, persisted=True),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("pricing_pricingstrategy", "computed_sum")
@@ -0,0 +1,52 @@
+"""add composite catalog indexes
+
+Revision ID: 3752e74551b6
+Revises: 4844bc6a8a1e
+Create Date: 2026-10-16 09:14:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "3752e74551b6"
+down_revision: Union[str, None] = "4844bc6a8a1e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "catalog_product_collection_updated_idx",
+        "catalog_product",
+        ["collection_id", "updated_at"],
+        postgresql_include=["label"],
+    )
+    op.create_index(
+        "catalog_collection_category_label_idx",
+        "catalog_collection",
+        ["category_id", "label"],
+    )
+    op.create_index(
+        "reference_enumentry_group_pct_idx",
+        "reference_enumentry",
+        ["group_id", "pct"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "reference_enumentry_group_pct_idx", table_name="reference_enumentry"
+    )
+    op.drop_index(
+        "catalog_collection_category_label_idx",
+        table_name="catalog_collection",
+    )
+    op.drop_index(
+        "catalog_product_collection_updated_idx", table_name="catalog_product"
+    )
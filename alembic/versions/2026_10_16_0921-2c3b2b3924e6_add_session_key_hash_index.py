@@ -0,0 +1,35 @@
+"""add hash index on django_session.session_key
+
+Revision ID: 2c3b2b3924e6
+Revises: 3752e74551b6
+Create Date: 2026-10-16 09:21:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "2c3b2b3924e6"
+down_revision: Union[str, None] = "3752e74551b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "django_session_session_key_hash",
+        "django_session",
+        ["session_key"],
+        postgresql_using="hash",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "django_session_session_key_hash", table_name="django_session"
+    )
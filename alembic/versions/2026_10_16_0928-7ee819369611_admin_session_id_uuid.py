@@ -0,0 +1,41 @@
+"""store admin_session.session_id as uuid
+
+Revision ID: 7ee819369611
+Revises: 2c3b2b3924e6
+Create Date: 2026-10-16 09:28:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "7ee819369611"
+down_revision: Union[str, None] = "2c3b2b3924e6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        "admin_session",
+        "session_id",
+        existing_type=sa.String(length=36),
+        type_=postgresql.UUID(as_uuid=True),
+        postgresql_using="session_id::uuid",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "admin_session",
+        "session_id",
+        existing_type=postgresql.UUID(as_uuid=True),
+        type_=sa.String(length=36),
+        postgresql_using="session_id::text",
+    )
@@ -0,0 +1,62 @@
+"""jsonb admin_session columns and gin indexes
+
+Revision ID: 8ff7b054ead6
+Revises: 7ee819369611
+Create Date: 2026-10-16 09:35:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "8ff7b054ead6"
+down_revision: Union[str, None] = "7ee819369611"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in ("device_info", "session_metadata"):
+        op.alter_column(
+            "admin_session",
+            column,
+            existing_type=sa.JSON(),
+            type_=postgresql.JSONB(),
+            postgresql_using=f"{column}::jsonb",
+        )
+    op.create_index(
+        "ix_pricing_parameters_gin",
+        "pricing_pricingstrategy",
+        ["parameters"],
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_catalog_collection_defaults_gin",
+        "catalog_collection",
+        ["defaults"],
+        postgresql_using="gin",
+        postgresql_ops={"defaults": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_catalog_collection_defaults_gin", table_name="catalog_collection"
+    )
+    op.drop_index(
+        "ix_pricing_parameters_gin", table_name="pricing_pricingstrategy"
+    )
+    for column in ("device_info", "session_metadata"):
+        op.alter_column(
+            "admin_session",
+            column,
+            existing_type=postgresql.JSONB(),
+            type_=sa.JSON(),
+            postgresql_using=f"{column}::json",
+        )
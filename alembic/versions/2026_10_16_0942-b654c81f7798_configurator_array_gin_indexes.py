@@ -0,0 +1,56 @@
+"""add gin indexes on configurator code arrays
+
+Revision ID: b654c81f7798
+Revises: 8ff7b054ead6
+Create Date: 2026-10-16 09:42:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b654c81f7798"
+down_revision: Union[str, None] = "8ff7b054ead6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_configuratortemplate_compatible_subcategories_gin",
+        "configurator_configuratortemplate",
+        ["compatible_subcategories"],
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_configurator_moduletype_extra_flags_gin",
+        "configurator_moduletype",
+        ["extra_flags"],
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_configurator_optiondefinition_roles_gin",
+        "configurator_optiondefinition",
+        ["roles"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_configurator_optiondefinition_roles_gin",
+        table_name="configurator_optiondefinition",
+    )
+    op.drop_index(
+        "ix_configurator_moduletype_extra_flags_gin",
+        table_name="configurator_moduletype",
+    )
+    op.drop_index(
+        "ix_configuratortemplate_compatible_subcategories_gin",
+        table_name="configurator_configuratortemplate",
+    )
@@ -0,0 +1,64 @@
+"""server-side defaults for created_at and updated_at
+
+Revision ID: 915ba9744dbb
+Revises: b654c81f7798
+Create Date: 2026-10-16 09:49:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "915ba9744dbb"
+down_revision: Union[str, None] = "b654c81f7798"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TIMESTAMPED_TABLES = (
+    ("admin_session", ("created_at",)),
+    ("admin_user", ("created_at", "updated_at")),
+    ("classification_functionalcategory", ("created_at", "updated_at")),
+    ("classification_group", ("created_at", "updated_at")),
+    ("pricing_pricingstrategy", ("created_at", "updated_at")),
+    ("reference_enumgroup", ("created_at", "updated_at")),
+    ("reference_unitofmeasure", ("created_at", "updated_at")),
+    ("classification_category", ("created_at", "updated_at")),
+    ("reference_enumentry", ("created_at", "updated_at")),
+    ("classification_subcategory", ("created_at", "updated_at")),
+    ("configurator_configuratortemplate", ("created_at", "updated_at")),
+    ("catalog_collection", ("created_at", "updated_at")),
+    ("configurator_moduletype", ("created_at", "updated_at")),
+    ("configurator_optiondefinition", ("created_at", "updated_at")),
+    ("catalog_product", ("created_at", "updated_at")),
+    ("catalog_configuration", ("created_at", "updated_at")),
+    ("catalog_mediaasset", ("created_at", "updated_at")),
+    ("catalog_section", ("created_at", "updated_at")),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, columns in TIMESTAMPED_TABLES:
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.DateTime(timezone=True),
+                server_default=sa.func.now(),
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, columns in TIMESTAMPED_TABLES:
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.DateTime(timezone=True),
+                server_default=None,
+            )
@@ -0,0 +1,47 @@
+"""add partial indexes on active and non-null rows
+
+Revision ID: 785384507959
+Revises: 915ba9744dbb
+Create Date: 2026-10-16 09:56:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "785384507959"
+down_revision: Union[str, None] = "915ba9744dbb"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_admin_session_active_user",
+        "admin_session",
+        ["user_id"],
+        postgresql_where=sa.text("is_active"),
+    )
+    op.create_index(
+        "ix_auth_user_active_username",
+        "auth_user",
+        ["username"],
+        postgresql_where=sa.text("is_active"),
+    )
+    op.create_index(
+        "ix_django_admin_log_object",
+        "django_admin_log",
+        ["object_id"],
+        postgresql_where=sa.text("object_id IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_django_admin_log_object", table_name="django_admin_log")
+    op.drop_index("ix_auth_user_active_username", table_name="auth_user")
+    op.drop_index("ix_admin_session_active_user", table_name="admin_session")
@@ -0,0 +1,39 @@
+"""cluster catalog tables on their listing indexes
+
+Revision ID: b608b0bc6c33
+Revises: 785384507959
+Create Date: 2026-10-16 10:03:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b608b0bc6c33"
+down_revision: Union[str, None] = "785384507959"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CLUSTERED_TABLES = (
+    ("catalog_product", "catalog_product_collection_idx"),
+    ("catalog_collection", "catalog_collection_category_idx"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CLUSTER запоминает индекс: плановый pg_repack -t <table> дальше
+    # переупаковывает таблицу по нему без долгой эксклюзивной блокировки
+    for table, index in CLUSTERED_TABLES:
+        op.execute(f"CLUSTER {table} USING {index}")
+        op.execute(f"ANALYZE {table}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, _ in CLUSTERED_TABLES:
+        op.execute(f"ALTER TABLE {table} SET WITHOUT CLUSTER")
@@ -0,0 +1,74 @@
+"""covering indexes for product configurations, media and sections
+
+Revision ID: 90027a059704
+Revises: b608b0bc6c33
+Create Date: 2026-10-16 10:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "90027a059704"
+down_revision: Union[str, None] = "b608b0bc6c33"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index(
+        "catalog_configuration_product_idx", table_name="catalog_configuration"
+    )
+    op.create_index(
+        "catalog_configuration_product_covering_idx",
+        "catalog_configuration",
+        ["product_id", "subcategory_id"],
+        postgresql_include=["id", "label"],
+    )
+    op.drop_index(
+        "catalog_mediaasset_product_idx", table_name="catalog_mediaasset"
+    )
+    op.create_index(
+        "catalog_mediaasset_product_covering_idx",
+        "catalog_mediaasset",
+        ["product_id"],
+        postgresql_include=["url", "tag"],
+    )
+    op.drop_index("catalog_configuration_idx", table_name="catalog_section")
+    op.create_index(
+        "catalog_section_configuration_covering_idx",
+        "catalog_section",
+        ["configuration_id"],
+        postgresql_include=["index", "size_cm", "module_type_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "catalog_section_configuration_covering_idx",
+        table_name="catalog_section",
+    )
+    op.create_index(
+        "catalog_configuration_idx", "catalog_section", ["configuration_id"]
+    )
+    op.drop_index(
+        "catalog_mediaasset_product_covering_idx",
+        table_name="catalog_mediaasset",
+    )
+    op.create_index(
+        "catalog_mediaasset_product_idx", "catalog_mediaasset", ["product_id"]
+    )
+    op.drop_index(
+        "catalog_configuration_product_covering_idx",
+        table_name="catalog_configuration",
+    )
+    op.create_index(
+        "catalog_configuration_product_idx",
+        "catalog_configuration",
+        ["product_id"],
+    )
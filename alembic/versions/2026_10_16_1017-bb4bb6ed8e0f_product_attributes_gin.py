@@ -0,0 +1,36 @@
+"""add gin index on catalog_product.attributes
+
+Revision ID: bb4bb6ed8e0f
+Revises: 90027a059704
+Create Date: 2026-10-16 10:17:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "bb4bb6ed8e0f"
+down_revision: Union[str, None] = "90027a059704"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "catalog_product_attributes_gin",
+        "catalog_product",
+        ["attributes"],
+        postgresql_using="gin",
+        postgresql_ops={"attributes": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "catalog_product_attributes_gin", table_name="catalog_product"
+    )
@@ -0,0 +1,43 @@
+"""add brin indexes on created_at
+
+Revision ID: 585839be42a7
+Revises: bb4bb6ed8e0f
+Create Date: 2026-10-16 10:24:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "585839be42a7"
+down_revision: Union[str, None] = "bb4bb6ed8e0f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BRIN_TABLES = (
+    "catalog_configuration",
+    "catalog_mediaasset",
+    "catalog_section",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in BRIN_TABLES:
+        op.create_index(
+            f"{table}_created_brin",
+            table,
+            ["created_at"],
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in BRIN_TABLES:
+        op.drop_index(f"{table}_created_brin", table_name=table)
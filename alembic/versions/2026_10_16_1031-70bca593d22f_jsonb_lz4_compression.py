@@ -0,0 +1,43 @@
+"""lz4 toast compression for catalog jsonb columns
+
+Revision ID: 70bca593d22f
+Revises: 585839be42a7
+Create Date: 2026-10-16 10:31:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "70bca593d22f"
+down_revision: Union[str, None] = "585839be42a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+LZ4_COLUMNS = (
+    ("catalog_product", "attributes"),
+    ("catalog_product", "flags"),
+    ("catalog_configuration", "options_selected"),
+    ("catalog_section", "flags"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Действует на новые и переписанные значения, старые остаются в pglz
+    for table, column in LZ4_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION lz4"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in LZ4_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION default"
+        )
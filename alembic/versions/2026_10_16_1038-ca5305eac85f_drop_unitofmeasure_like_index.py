@@ -0,0 +1,38 @@
+"""drop unused like index on reference_unitofmeasure
+
+Revision ID: ca5305eac85f
+Revises: 70bca593d22f
+Create Date: 2026-10-16 10:38:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "ca5305eac85f"
+down_revision: Union[str, None] = "70bca593d22f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # id никогда не ищется по LIKE, индекс только замедляет запись
+    op.drop_index(
+        "reference_unitofmeasure_id_ad4f0d6e_like",
+        table_name="reference_unitofmeasure",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "reference_unitofmeasure_id_ad4f0d6e_like",
+        "reference_unitofmeasure",
+        ["id"],
+        unique=False,
+        postgresql_ops={"id": "varchar_pattern_ops"},
+    )
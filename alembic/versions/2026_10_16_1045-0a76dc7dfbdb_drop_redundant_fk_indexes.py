@@ -0,0 +1,50 @@
+"""drop indexes duplicated by unique constraints
+
+Revision ID: 0a76dc7dfbdb
+Revises: ca5305eac85f
+Create Date: 2026-10-16 10:45:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0a76dc7dfbdb"
+down_revision: Union[str, None] = "ca5305eac85f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+REDUNDANT_INDEXES = (
+    (
+        "classification_functionalcategory_categories",
+        "classification_functionalcategory_funccat_group_idx",
+        "functionalcategory_id",
+    ),
+    (
+        "configurator_moduletype",
+        "configurator_moduletype_template_idx",
+        "template_id",
+    ),
+    (
+        "configurator_optiondefinition",
+        "configurator_optiondefinition_template_group_idx",
+        "template_id",
+    ),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Уникальные ограничения по этим колонкам уже создают btree-индекс
+    for table, index, _ in REDUNDANT_INDEXES:
+        op.drop_index(index, table_name=table)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, index, column in REDUNDANT_INDEXES:
+        op.create_index(index, table, [column], unique=False)
@@ -0,0 +1,39 @@
+"""cache identity values on auth join tables
+
+Revision ID: d03f7df21e5b
+Revises: 0a76dc7dfbdb
+Create Date: 2026-10-16 10:52:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d03f7df21e5b"
+down_revision: Union[str, None] = "0a76dc7dfbdb"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CACHED_IDENTITY_TABLES = (
+    "auth_user_groups",
+    "auth_group_permissions",
+    "auth_user_user_permissions",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # nextval берет значения из кэша сессии,
+    # а не обращается к последовательности на каждую строку
+    for table in CACHED_IDENTITY_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET CACHE 50")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in CACHED_IDENTITY_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET CACHE 1")
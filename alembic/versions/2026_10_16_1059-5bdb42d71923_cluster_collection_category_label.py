@@ -0,0 +1,39 @@
+"""cluster catalog_collection on the category label index
+
+Revision ID: 5bdb42d71923
+Revises: d03f7df21e5b
+Create Date: 2026-10-16 10:59:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "5bdb42d71923"
+down_revision: Union[str, None] = "d03f7df21e5b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLE = "catalog_collection"
+REDUNDANT_INDEX = "catalog_collection_category_idx"
+CLUSTER_INDEX = "catalog_collection_category_label_idx"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Составной индекс начинается с category_id и покрывает те же запросы.
+    # CLUSTER ON только переносит отметку: строки уже лежат по category_id,
+    # а следующий pg_repack -t catalog_collection упакует их
+    # по (category_id, label)
+    op.execute(f"ALTER TABLE {TABLE} CLUSTER ON {CLUSTER_INDEX}")
+    op.drop_index(REDUNDANT_INDEX, table_name=TABLE)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(REDUNDANT_INDEX, TABLE, ["category_id"], unique=False)
+    op.execute(f"ALTER TABLE {TABLE} CLUSTER ON {REDUNDANT_INDEX}")
@@ -1,10 +1,11 @@
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 from core.config import settings
 from core.crud.collections.collections import get_all_collections, get_all_products_by_collection_id, get_all_categories_by_collection_id
-from sqlalchemy.ext.asyncio import AsyncSession
-from fastapi import Depends, Query
+from fastapi import Depends
 from core.models.db_helper import db_helper
-from core.schemas.collections.collections_query_schema import CatalogCollectionQueryParamsSortByOrder, CatalogCollectionQueryParamsSubcategoryId
+from core.cache.cache_helper import cache_helper
+from core.schemas.collections.collections_query_schema import CatalogCollectionQueryParamsSortByOrder, CatalogCollectionQueryParamsSubcategoryId, get_collection_query_params
 from typing import List
 
 collections_router = APIRouter(
@@ -13,32 +14,50 @@ collections_router = APIRouter(
 )
 
 
-@collections_router.get("", description="Get all products by query paramss")
+def collections_cache_key(query_params: CatalogCollectionQueryParamsSortByOrder, **_) -> str:
+    return (
+        f"{settings.cache.collections_key}:{query_params.sort_by.value}:{query_params.order.value}"
+        f":{query_params.limit}:{query_params.after_id}"
+    )
+
+def collection_products_cache_key(collection_id: int, **_) -> str:
+    return f"{settings.cache.collection_key}{collection_id}:products"
+
+def collection_categories_cache_key(collection_id: int, **_) -> str:
+    return f"{settings.cache.collection_key}{collection_id}:categories"
+
+
+@collections_router.get("", response_class=ORJSONResponse, description="Get all products by query paramss")
+@cache_helper.cached(key_builder = collections_cache_key)
 async def get_collections(
-    query_params: CatalogCollectionQueryParamsSortByOrder = Query(...),
-    session: AsyncSession = Depends(db_helper.session_getter)
+    query_params: CatalogCollectionQueryParamsSortByOrder = Depends(get_collection_query_params)
 ):
     sort_by_field = query_params.sort_by.value
     order_direction = query_params.order.value
-    collections = await get_all_collections(
-        session = session,
-        sort_by_field = sort_by_field,
-        order_direction = order_direction
-    )
+    async with db_helper.session_factory() as session:
+        collections = await get_all_collections(
+            session = session,
+            sort_by_field = sort_by_field,
+            order_direction = order_direction,
+            limit = query_params.limit,
+            after_id = query_params.after_id
+        )
     return collections
 
-@collections_router.get("/{collection_id}/products", description="Get all products by collection id")
+@collections_router.get("/{collection_id}/products", response_class=ORJSONResponse, description="Get all products by collection id")
+@cache_helper.cached(key_builder = collection_products_cache_key)
 async def get_products_by_collection_id(
-    collection_id: int,
-    session: AsyncSession = Depends(db_helper.session_getter)
+    collection_id: int
 ):
-    products = await get_all_products_by_collection_id(session=session, collection_id=collection_id)
+    async with db_helper.session_factory() as session:
+        products = await get_all_products_by_collection_id(session=session, collection_id=collection_id)
     return products
 
-@collections_router.get("/{collection_id}/categories", description="Get all categories by collection id")
+@collections_router.get("/{collection_id}/categories", response_class=ORJSONResponse, description="Get all categories by collection id")
+@cache_helper.cached(key_builder = collection_categories_cache_key)
 async def get_categories_by_collection_id(
-    collection_id: int,
-    session: AsyncSession = Depends(db_helper.session_getter)
+    collection_id: int
 ):
-    categories = await get_all_categories_by_collection_id(session = session, collection_id = collection_id)
+    async with db_helper.session_factory() as session:
+        categories = await get_all_categories_by_collection_id(session = session, collection_id = collection_id)
     return categories
\ No newline at end of file
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Body, Depends
+from fastapi import APIRouter, Body, Response
+from fastapi.responses import ORJSONResponse
 from core.config import settings
 from core.crud.prices.prices import get_all_prices, sum_price
 from core.schemas.prices_schema import PriceJsonSchema, PriceJsonSchemaSum, PriceJsonSchemaSumWithName
-from sqlalchemy.ext.asyncio import AsyncSession
 from core.models.db_helper import db_helper
+from core.cache.cache_helper import cache_helper
 from typing import List
 
 prices_router = APIRouter(
@@ -12,18 +13,17 @@ prices_router = APIRouter(
 )
 
 # response_model = list[PriceJsonSchema]
-@prices_router.get("", response_model=List[PriceJsonSchemaSumWithName], description="Get all pricing strategy with sum")
-async def get_prices(
-    session: AsyncSession = Depends(db_helper.session_getter)
-):
-    
-    prices = await get_all_prices(session = session)
+@prices_router.get("", response_class=ORJSONResponse, responses={200: {"model": List[PriceJsonSchemaSumWithName]}}, description="Get all pricing strategy with sum")
+@cache_helper.cached(key_builder = lambda **_: settings.cache.prices_key)
+async def get_prices():
+    async with db_helper.session_factory() as session:
+        prices = await get_all_prices(session = session)
     return prices
 
-@prices_router.post("/sum", response_model=PriceJsonSchemaSum, description="Get sum of gave pricing strategy")
+@prices_router.post("/sum", response_class=ORJSONResponse, responses={200: {"model": PriceJsonSchemaSum}}, description="Get sum of gave pricing strategy")
 async def post_prices(
-    session: AsyncSession = Depends(db_helper.session_getter),
     body: PriceJsonSchema = Body(...)
 ):
-    price = await sum_price(session=session,body=body)
-    return price
\ No newline at end of file
+    price = await sum_price(body=body)
+    #Модель уже провалидирована, pydantic-core сериализует ее в JSON за один проход без jsonable_encoder
+    return Response(content = price.model_dump_json(), media_type = "application/json")
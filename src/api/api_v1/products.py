@@ -1,20 +1,27 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 from core.config import settings
-from sqlalchemy.ext.asyncio import AsyncSession
 from core.models.db_helper import db_helper
+from core.cache.cache_helper import cache_helper
 from core.crud.products.products import get_configuration_by_productid
-from core.schemas.products.products_query_schema import ProductsQueryParamsSubcategoryId
+from core.schemas.products.products_query_schema import ProductsQueryParamsSubcategoryId, get_products_query_params
 
 products_router = APIRouter(
     prefix = settings.api.v1.products,
     tags = ["Products"]
 )
 
-@products_router.get("/{product_id}/configurations", description="Get configuration by product id and subcategory id")
+
+def product_configurations_cache_key(product_id: int, query_params: ProductsQueryParamsSubcategoryId, **_) -> str:
+    return f"{settings.cache.products_key}{product_id}:{query_params.subcategory_id}:configurations"
+
+
+@products_router.get("/{product_id}/configurations", response_class=ORJSONResponse, description="Get configuration by product id and subcategory id")
+@cache_helper.cached(key_builder = product_configurations_cache_key)
 async def get_configuration_of_product(
     product_id: int,
-    query_params: ProductsQueryParamsSubcategoryId = Query(...),
-    session: AsyncSession = Depends(db_helper.session_getter)
+    query_params: ProductsQueryParamsSubcategoryId = Depends(get_products_query_params)
 ):
-    result = await  get_configuration_by_productid(product_id = product_id, session = session, subcategory_id = query_params.subcategory_id)
+    async with db_helper.session_factory() as session:
+        result = await get_configuration_by_productid(product_id = product_id, session = session, subcategory_id = query_params.subcategory_id)
     return result
\ No newline at end of file
@@ -0,0 +1,123 @@
+import functools
+import hashlib
+import inspect
+import orjson
+from typing import Callable, Optional, Sequence
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from core.config import settings
+from core.utils.logger import logger as log
+
+
+#В redis хранится ETag ответа и сразу за ним тело: '"<32 hex>"' + body
+ETAG_LENGTH = 34
+
+
+def make_etag(body: bytes) -> bytes:
+    return b'"' + hashlib.blake2b(body, digest_size = 16).hexdigest().encode() + b'"'
+
+def etag_matches(request: Request, etag: bytes) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag.decode() in candidates
+
+
+class CacheHelper:
+    def __init__(
+            self,
+            url: str,
+            ttl: int = 300, #Время жизни ключа по умолчанию, в секундах
+            prefixes: Sequence[str] = (), #Префиксы ключей, которые сбрасываются через invalidate
+        ) -> None:
+            self.ttl = ttl
+            self.prefixes = tuple(prefixes)
+            self.client: Redis = Redis.from_url(url = url)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            return await self.client.get(key)
+        except RedisError as exc:
+            log.warning(f"Cache get failed for {key}: {exc}")
+            return None
+
+    @staticmethod
+    def index_key(prefix: str) -> str:
+        #Множество ключей с этим префиксом, чтобы сбрасывать их без SCAN по всему redis
+        return f"keys:{prefix}"
+
+    async def set(self, key: str, body: bytes, ttl: Optional[int] = None) -> None:
+        ttl = ttl or self.ttl
+        try:
+            async with self.client.pipeline(transaction = False) as pipe:
+                pipe.set(key, body, ex = ttl)
+                for prefix in self.prefixes:
+                    if key.startswith(prefix):
+                        #Множество живет не меньше своих ключей и само пропадает, когда они истекли
+                        pipe.sadd(self.index_key(prefix), key)
+                        pipe.expire(self.index_key(prefix), max(ttl, self.ttl))
+                await pipe.execute()
+        except RedisError as exc:
+            log.warning(f"Cache set failed for {key}: {exc}")
+
+    async def invalidate(self, *prefixes: str) -> None:
+        try:
+            #Множество читается и удаляется атомарно: ключ, записанный после, попадет в новое множество
+            async with self.client.pipeline(transaction = True) as pipe:
+                for prefix in prefixes:
+                    pipe.smembers(self.index_key(prefix))
+                    pipe.delete(self.index_key(prefix))
+                results = await pipe.execute()
+            keys = set().union(*results[::2])
+            if keys:
+                await self.client.delete(*keys)
+        except RedisError as exc:
+            log.warning(f"Cache invalidation failed for {prefixes}: {exc}")
+
+    def cached(self, key_builder: Callable[..., str], ttl: Optional[int] = None):
+        # Кэширует готовое JSON-тело ответа эндпоинта вместе с его ETag.
+        # При промахе вызывает сам эндпоинт, при совпадении If-None-Match отдает 304 без тела
+        def decorator(func):
+            @functools.wraps(func)
+            async def wrapper(*args, request: Request, **kwargs) -> Response:
+                key = key_builder(**kwargs)
+                cached_value = await self.get(key)
+                if cached_value is None:
+                    result = await func(*args, **kwargs)
+                    body = orjson.dumps(result, default = jsonable_encoder)
+                    etag = make_etag(body)
+                    await self.set(key, etag + body, ttl)
+                else:
+                    etag, body = cached_value[:ETAG_LENGTH], cached_value[ETAG_LENGTH:]
+
+                headers = {"ETag": etag.decode()}
+                if etag_matches(request, etag):
+                    return Response(status_code = 304, headers = headers)
+                return Response(content = body, media_type = "application/json", headers = headers)
+
+            #FastAPI должен передать в обертку Request, сам эндпоинт его не принимает
+            signature = inspect.signature(func)
+            wrapper.__signature__ = signature.replace(parameters = [
+                *signature.parameters.values(),
+                inspect.Parameter("request", inspect.Parameter.KEYWORD_ONLY, annotation = Request),
+            ])
+            return wrapper
+        return decorator
+
+    async def dispose(self) -> None:
+        await self.client.aclose()
+
+
+cache_helper = CacheHelper(
+    url = settings.cache.REDIS_URL,
+    ttl = settings.cache.ttl,
+    prefixes = (
+        settings.cache.prices_key,
+        settings.cache.collections_key,
+        settings.cache.collection_key,
+        settings.cache.products_key,
+    )
+)
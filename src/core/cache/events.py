@@ -0,0 +1,62 @@
+import asyncio
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.cache.cache_helper import cache_helper
+from core.config import settings
+from core.utils.logger import logger as log
+from core.models.models import PricingPricingstrategy, CatalogCollection, CatalogConfiguration, CatalogProduct, ClassificationCategory, ClassificationSubcategory, ConfiguratorConfiguratortemplate
+
+
+#Какие ключи кэша устаревают при изменении строк модели
+INVALIDATED_PREFIXES: dict[type, tuple[str, ...]] = {
+    PricingPricingstrategy: (settings.cache.prices_key, settings.cache.collections_key),
+    CatalogCollection: (settings.cache.collections_key, settings.cache.collection_key),
+    ClassificationCategory: (settings.cache.collections_key, settings.cache.collection_key),
+    ConfiguratorConfiguratortemplate: (settings.cache.collections_key,),
+    CatalogProduct: (settings.cache.collection_key, settings.cache.products_key),
+    ClassificationSubcategory: (settings.cache.collection_key, settings.cache.products_key),
+    CatalogConfiguration: (settings.cache.products_key,),
+}
+
+#Ключ в session.info, где до коммита копятся префиксы измененных моделей
+STALE_PREFIXES_KEY = "stale_cache_prefixes"
+
+_pending_tasks: set[asyncio.Task] = set()
+
+
+def invalidate_on_commit(session: Session | AsyncSession, *models: type) -> None:
+    # Помечает кэш моделей устаревшим: ключи удаляются только после коммита транзакции.
+    # Core-запросы (COPY, insert, upsert) не вызывают событий ORM и помечают модели сами
+    prefixes = session.info.setdefault(STALE_PREFIXES_KEY, set())
+    for model in models:
+        prefixes.update(INVALIDATED_PREFIXES.get(model, ()))
+
+class CacheInvalidatingSession(Session):
+    #Синхронная сессия за AsyncSession приложения: только ее коммиты сбрасывают кэш ответов
+    pass
+
+
+@event.listens_for(CacheInvalidatingSession, "after_flush")
+def _collect_flushed(session: Session, flush_context) -> None:
+    invalidate_on_commit(session, *{type(obj) for obj in (*session.new, *session.dirty, *session.deleted)})
+
+@event.listens_for(CacheInvalidatingSession, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    # До коммита параллельный GET прочитал бы старые строки и снова положил их в redis на весь ttl
+    prefixes = session.info.pop(STALE_PREFIXES_KEY, None)
+    if not prefixes:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        log.warning("Cache invalidation skipped for %s: no running event loop", prefixes)
+        return
+    #Ссылка держит задачу до завершения, иначе сборщик мусора может удалить ее раньше
+    task = loop.create_task(cache_helper.invalidate(*prefixes))
+    _pending_tasks.add(task)
+    task.add_done_callback(_pending_tasks.discard)
+
+@event.listens_for(CacheInvalidatingSession, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(STALE_PREFIXES_KEY, None)
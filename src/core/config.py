@@ -1,6 +1,7 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
+from functools import lru_cache
 
 
 
@@ -8,10 +9,21 @@ from typing import List
 class AppConfig(BaseModel):
     host: str = "api"
     port: int = 5000
+    gzip_minimum_size: int = 500 #Ответы меньше этого размера в байтах не сжимаются
+    gzip_compresslevel: int = 5
+    log_level: str = "INFO"
     
 
 class EnvConfig(BaseSettings):
     DB_URL: str
+    REDIS_URL: str = "redis://localhost:6379/0"
+    USE_PGBOUNCER: bool = False
+    SQLA_LAZY: str = "select"
+    DB_ECHO: bool = False
+    DB_WARMUP: bool = True
+    LOG_LEVEL: str = "INFO"
+    CORS_ORIGINS: List[str] = ["*"]
+    CORS_ORIGIN_REGEX: Optional[str] = None
 
     model_config = SettingsConfigDict(env_file=".env")
 
@@ -32,6 +44,16 @@ class DbConfig(BaseModel):
     echo_pool: bool = False
     pool_size: int = 50
     max_overflow:int = 10
+    pool_pre_ping: bool = True
+    pool_recycle: int = 1800
+    pool_use_lifo: bool = True
+    statement_cache_size: int = 1024
+    prepared_statement_cache_size: int = 512
+    query_cache_size: int = 1200
+    insertmanyvalues_page_size: int = 1000
+    use_pgbouncer: bool = False
+    warmup: bool = True #Прогревать кэш скомпилированных запросов при старте
+    lazy: str = "select" #Стратегия загрузки связей без явной настройки, в CI ставится raise_on_sql
     
     naming_convention: dict[str, str] = {
         "ix": "ix_%(column_0_label)s",
@@ -41,21 +63,53 @@ class DbConfig(BaseModel):
         "pk": "pk_%(table_name)s"
     }
 
+class CacheConfig(BaseModel):
+    REDIS_URL: str = ""
+
+    ttl: int = 300 #Время жизни закэшированного ответа в секундах
+    prices_key: str = "prices:v1"
+    collections_key: str = "collections:v1"
+    collection_key: str = "col:" #Ответы по одной коллекции: col:<id>:products, col:<id>:categories
+    products_key: str = "prod:"
+
 
   
 
+class CorsConfig(BaseModel):
+    origins: List[str] = ["*"]
+    origin_regex: Optional[str] = None
+    methods: List[str] = ["GET", "POST"]
+    headers: List[str] = ["content-type", "if-none-match"] #if-none-match нужен для условных запросов по ETag
+    expose_headers: List[str] = ["etag"]
+
 class Settings(BaseModel):
     run: AppConfig = AppConfig()
     env: EnvConfig = EnvConfig()
+    run.log_level = env.LOG_LEVEL
     api: ApiPrefix = ApiPrefix()
     db: DbConfig = DbConfig()
     db.DB_URL = env.DB_URL
+    db.use_pgbouncer = env.USE_PGBOUNCER
+    db.lazy = env.SQLA_LAZY
+    db.echo = env.DB_ECHO
+    db.warmup = env.DB_WARMUP
+    cache: CacheConfig = CacheConfig()
+    cache.REDIS_URL = env.REDIS_URL
+    cors: CorsConfig = CorsConfig()
+    cors.origins = env.CORS_ORIGINS
+    cors.origin_regex = env.CORS_ORIGIN_REGEX
 
     
 
 
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    #.env читается один раз на процесс, повторные вызовы отдают тот же объект
+    return Settings()
+
+
+settings = get_settings()
 
     
\ No newline at end of file
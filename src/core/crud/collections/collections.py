@@ -1,22 +1,71 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, text
-from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy import select, bindparam
+from sqlalchemy.orm import joinedload, lazyload, selectinload
 from core.models.models import CatalogCollection, CatalogProduct, ClassificationSubcategory, ClassificationCategory
-from typing import Sequence
+from typing import Optional, Sequence
 from fastapi import HTTPException
 
+SORT_COLUMNS = {
+    "created_at": CatalogCollection.created_at,
+    "updated_at": CatalogCollection.updated_at,
+    "label": CatalogCollection.label,
+    "defaults": CatalogCollection.defaults,
+    "id": CatalogCollection.id,
+    "pricing_strategy_id": CatalogCollection.pricing_strategy_id,
+    "category_id": CatalogCollection.category_id,
+    "template_id": CatalogCollection.template_id,
+}
+
+PRODUCT_COLUMNS = [column.key for column in CatalogProduct.__table__.columns]
+SUBCATEGORY_COLUMNS = [column.key for column in ClassificationSubcategory.__table__.columns]
+
+# Один запрос вместо двух: коллекция LEFT JOIN продукты LEFT JOIN подкатегории.
+# Нет строк - нет коллекции, одна строка с NULL продуктом - коллекция пуста.
+# Выбираются колонки, а не сущности: для списка только на чтение не нужны ORM-объекты и identity map
+STMT_PRODUCTS_BY_COLLECTION = (
+    select(
+        CatalogCollection.id.label("found_collection_id"),
+        *(getattr(CatalogProduct, key) for key in PRODUCT_COLUMNS),
+        *(getattr(ClassificationSubcategory, key).label(f"subcategory__{key}") for key in SUBCATEGORY_COLUMNS)
+    )
+    .outerjoin(CatalogProduct, CatalogProduct.collection_id == CatalogCollection.id)
+    .outerjoin(ClassificationSubcategory, ClassificationSubcategory.id == CatalogProduct.subcategory_id)
+    .where(CatalogCollection.id == bindparam("collection_id"))
+    .execution_options(yield_per = 1000)
+)
+
+STMT_COLLECTION_WITH_CATEGORIES = (
+    select(CatalogCollection)
+    .where(CatalogCollection.id == bindparam("collection_id"))
+    .options(joinedload(CatalogCollection.category)
+    .load_only(ClassificationCategory.label))
+    #Стратегия и шаблон по умолчанию грузятся joined, здесь они не нужны
+    .options(lazyload(CatalogCollection.pricing_strategy), lazyload(CatalogCollection.template))
+)
+
 
 async def get_all_collections(
         session: AsyncSession,
         sort_by_field: str,
-        order_direction: str
+        order_direction: str,
+        limit: int = 50,
+        after_id: Optional[int] = None
     ) -> Sequence[CatalogCollection]:
+    sort_column = SORT_COLUMNS[sort_by_field]
+    order_columns = [sort_column] if sort_column is CatalogCollection.id else [sort_column, CatalogCollection.id]
     stmt = (select(CatalogCollection)
-    .options(joinedload(CatalogCollection.category))
-    .options(joinedload(CatalogCollection.pricing_strategy))
+    .options(selectinload(CatalogCollection.category))
+    .options(selectinload(CatalogCollection.pricing_strategy))
     .options(joinedload(CatalogCollection.template))
-    .order_by(text(f"{sort_by_field} {order_direction}"))
+    #id добавлен вторым ключом: при равных значениях поля сортировки порядок страниц не плавает
+    .order_by(*(column.asc() if order_direction == "asc" else column.desc() for column in order_columns))
+    .limit(limit)
     )
+    if after_id is not None:
+        # Keyset-пагинация по первичному ключу: поиск по индексу вместо OFFSET
+        stmt = stmt.where(
+            CatalogCollection.id > after_id if order_direction == "asc" else CatalogCollection.id < after_id
+        )
     
     executed = await session.execute(stmt)
     result = executed.scalars().all()
@@ -27,58 +76,41 @@ async def get_all_products_by_collection_id(
         session: AsyncSession,
         collection_id: int,
     ):
-    stmt_get_collection = (
-        select(CatalogCollection)
-        .where(CatalogCollection.id == collection_id)
+    # Серверный курсор: строки приходят пачками по 1000, а не всем результатом сразу
+    streamed_product = await session.stream(
+        STMT_PRODUCTS_BY_COLLECTION,
+        {"collection_id": collection_id}
     )
-    executed_stmt_collection = await session.execute(stmt_get_collection)
-    result_collection = executed_stmt_collection.scalars().all()
+    collection_found = False
+    result_product = []
+    async for partition in streamed_product.mappings().partitions():
+        collection_found = True
+        for row in partition:
+            if row["id"] is None:
+                continue
+            product = {key: row[key] for key in PRODUCT_COLUMNS}
+            product["subcategory"] = (
+                {key: row[f"subcategory__{key}"] for key in SUBCATEGORY_COLUMNS}
+                if row["subcategory__id"] is not None else None
+            )
+            result_product.append(product)
 
-    if not result_collection:
+    if not collection_found:
         raise HTTPException(status_code=404, detail="Collection not found")
-    
-    # stmt_get_category = (
-    #     select(ClassificationCategory)
-    #     .where(ClassificationCategory.id == category_id)
-    # )
-    # executed_stmt_category = await session.execute(stmt_get_category)
-    # result_category = executed_stmt_category.scalars().all()
-
-    # if not result_category:
-    #     raise HTTPException(status_code=404, detail="Category not found")
-    
-    stmt_product = (
-        select(CatalogProduct)
-        .where(CatalogProduct.collection_id == collection_id)
-        .options(joinedload(CatalogProduct.subcategory))
 
-    )
-    executed_stmt_product = await session.execute(stmt_product)
-    result_product = executed_stmt_product.scalars().all()
-    
     return result_product
 
 async def get_all_categories_by_collection_id(
         session: AsyncSession,
         collection_id: int,
     ):
-    stmt_get_collection = (
-        select(CatalogCollection)
-        .where(CatalogCollection.id == collection_id)
+    executed_col_w_cat = await session.execute(
+        STMT_COLLECTION_WITH_CATEGORIES,
+        {"collection_id": collection_id}
     )
-    executed_stmt_collection = await session.execute(stmt_get_collection)
-    result_collection = executed_stmt_collection.scalars().all()
+    result_col_w_cat = executed_col_w_cat.scalars().all()
 
-    if not result_collection:
+    if not result_col_w_cat:
         raise HTTPException(status_code=404, detail="Collection not found")
-    
-    stmt_collection_with_categories = (
-        select(CatalogCollection)
-        .where(CatalogCollection.id == collection_id)
-        .options(joinedload(CatalogCollection.category)
-        .load_only(ClassificationCategory.label))
-    )
-    executed_col_w_cat = await session.execute(stmt_collection_with_categories)
-    result_col_w_cat = executed_col_w_cat.scalars().all()
 
     return result_col_w_cat
\ No newline at end of file
@@ -1,40 +1,39 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from core.models.models import PricingPricingstrategy
-from core.schemas.prices_schema import PriceJsonSchema, PriceJsonSchemaSum, PriceJsonSchemaSumWithName
+from core.schemas.prices_schema import PriceJsonSchema, PriceJsonSchemaSum
 from typing import List
+from decimal import Decimal, ROUND_HALF_UP
 
 
-async def get_all_prices(session: AsyncSession) -> List[PriceJsonSchemaSumWithName]:
-    stmt = select(PricingPricingstrategy)
-    executed = await session.execute(stmt)
-    result = executed.scalars().all()
-    output: List[PriceJsonSchemaSumWithName] = []
-    for idx, value in enumerate(result):
-        param = value.parameters["parameters"]
-        res = PriceJsonSchema(parameters=dict(param))
-        sum = (
-            
-            res.parameters.pricePerMeter * ((res.parameters.marginPct + 100) / 100) + 
-                (
-                    res.parameters.extras.ottomanFlat.count * res.parameters.extras.ottomanFlat.price + 
-                    res.parameters.extras.mechanismFlat.count * res.parameters.extras.mechanismFlat.price
-                )
-        ) * ((res.parameters.fabricPct.category + 100) / 100)
-        res = PriceJsonSchemaSumWithName(engine=value.engine,parameters=dict(res.parameters), sum=round(sum, 2))
-        output.append(res)
-    return output
+STMT_PRICES = select(
+    PricingPricingstrategy.engine,
+    PricingPricingstrategy.parameters["parameters"].label("parameters"),
+    PricingPricingstrategy.computed_sum.label("sum")
+).execution_options(yield_per = 500)
 
-async def sum_price(session: AsyncSession, body: PriceJsonSchema) -> PriceJsonSchemaSum:
+
+async def get_all_prices(session: AsyncSession) -> List[dict]:
+    # Строки забираются пачками по 500 через серверный курсор.
+    # parameters валидируются при записи, на чтении отдаем их как есть
+    streamed = await session.stream(STMT_PRICES)
+    result = []
+    async for partition in streamed.mappings().partitions():
+        result.extend(dict(row) for row in partition)
+    return result
+
+async def sum_price(body: PriceJsonSchema) -> PriceJsonSchemaSum:
     param = body.parameters
-    
-    sum = (
-        param.pricePerMeter * ((param.marginPct + 100) / 100) + 
-            (
-                param.extras.ottomanFlat.count * param.extras.ottomanFlat.price + 
-                param.extras.mechanismFlat.count * param.extras.mechanismFlat.price
-            )
-    ) * ((param.fabricPct.category + 100) / 100)
-    print(type(body.parameters))
-    output = PriceJsonSchemaSum(parameters=dict(body.parameters), sum=sum)
+    ottoman = param.extras.ottomanFlat
+    mechanism = param.extras.mechanismFlat
+    margin = Decimal(param.marginPct + 100) / 100
+    fabric = Decimal(param.fabricPct.category + 100) / 100
+
+    #Точная арифметика и округление половины от нуля, как round(numeric, 2) у computed_sum в GET /prices.
+    #float и round() с банковским округлением расходились с ним в копейках
+    sum = ((
+        param.pricePerMeter * margin +
+        (ottoman.count * ottoman.price + mechanism.count * mechanism.price)
+    ) * fabric).quantize(Decimal("0.01"), rounding = ROUND_HALF_UP)
+    output = PriceJsonSchemaSum(parameters=param, sum=float(sum))
     return output
\ No newline at end of file
@@ -1,36 +1,41 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, bindparam
 from core.models.models import CatalogProduct, CatalogConfiguration, ClassificationSubcategory
 from fastapi import HTTPException
 
+STMT_PRODUCT = (
+    select(CatalogProduct.id)
+    .where(CatalogProduct.id == bindparam("product_id"))
+)
+
+STMT_SUBCATEGORY = (
+    select(ClassificationSubcategory.id)
+    .where(ClassificationSubcategory.id == bindparam("subcategory_id"))
+)
+
+STMT_CONFIGURATION = (
+    select(CatalogConfiguration)
+    .where(CatalogConfiguration.product_id == bindparam("product_id"))
+    .where(CatalogConfiguration.subcategory_id == bindparam("subcategory_id"))
+)
+
 async def get_configuration_by_productid(session: AsyncSession, product_id:int, subcategory_id: int):
-    stmt_product = (
-        select(CatalogProduct)
-        .where(CatalogProduct.id == product_id)
-    )
-    executed_product = await session.execute(stmt_product)
+    executed_product = await session.execute(STMT_PRODUCT, {"product_id": product_id})
     result_product = executed_product.scalars().all()
 
     if not result_product:
         raise HTTPException(status_code=404, detail="Product not found")
     
-    stmt_subcategory = (
-        select(ClassificationSubcategory)
-        .where(ClassificationSubcategory.id == subcategory_id)
-    )
-    executed_subcategory =  await session.execute(stmt_subcategory)
+    executed_subcategory =  await session.execute(STMT_SUBCATEGORY, {"subcategory_id": subcategory_id})
     result_subcategory = executed_subcategory.scalars().all()
 
     if not result_subcategory:
         raise HTTPException(status_code=404, detail="Subcategory not found")
-    
-    stmt_configuration = (
-        select(CatalogConfiguration)
-        .where(CatalogConfiguration.product_id == product_id)
-        .where(CatalogConfiguration.subcategory_id == subcategory_id)
-    )
 
-    executed_configuration = await session.execute(stmt_configuration)
+    executed_configuration = await session.execute(
+        STMT_CONFIGURATION,
+        {"product_id": product_id, "subcategory_id": subcategory_id}
+    )
     result_configuration = executed_configuration.scalars().all()
 
     if not result_configuration:
@@ -38,4 +43,4 @@ async def get_configuration_by_productid(session: AsyncSession, product_id:int,
     
     return result_configuration
 
-    
\ No newline at end of file
+    
@@ -0,0 +1,40 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.models.models import STMT_BY_ID
+from core.crud.prices.prices import STMT_PRICES
+from core.crud.products.products import STMT_PRODUCT, STMT_SUBCATEGORY, STMT_CONFIGURATION
+from core.crud.collections.collections import (
+    SORT_COLUMNS,
+    STMT_PRODUCTS_BY_COLLECTION,
+    STMT_COLLECTION_WITH_CATEGORIES,
+    get_all_collections,
+)
+
+
+# Запросы эндпоинтов с параметрами, под которые нет строк.
+# Ключ кэша скомпилированных выражений не зависит от значений параметров
+WARMUP_STATEMENTS = (
+    (STMT_PRICES, {}),
+    (STMT_PRODUCTS_BY_COLLECTION, {"collection_id": 0}),
+    (STMT_COLLECTION_WITH_CATEGORIES, {"collection_id": 0}),
+    (STMT_PRODUCT, {"product_id": 0}),
+    (STMT_SUBCATEGORY, {"subcategory_id": 0}),
+    (STMT_CONFIGURATION, {"product_id": 0, "subcategory_id": 0}),
+    *((stmt, {"id": 0}) for stmt in STMT_BY_ID.values()),
+)
+
+
+async def warm_statement_cache(session: AsyncSession) -> None:
+    # Прогон запросов при старте: компиляция SQLAlchemy и prepare asyncpg
+    # выполняются до первого запроса клиента, а не на нем
+    for stmt, params in WARMUP_STATEMENTS:
+        streamed = await session.stream(stmt, params)
+        await streamed.close()
+
+    for sort_by_field in SORT_COLUMNS:
+        for order_direction in ("asc", "desc"):
+            await get_all_collections(
+                session = session,
+                sort_by_field = sort_by_field,
+                order_direction = order_direction,
+                limit = 1
+            )
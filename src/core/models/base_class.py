@@ -5,6 +5,9 @@ from core.config import settings
 
 class Base(DeclarativeBase):
 
+    #Серверные created_at/updated_at возвращаются через RETURNING в том же INSERT/UPDATE
+    __mapper_args__ = {"eager_defaults": True}
+
     meatadata = MetaData(
         naming_convention = settings.db.naming_convention
     )
@@ -0,0 +1,120 @@
+import orjson
+from sqlalchemy import JSON, func, insert, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.schema import CreateIndex, DropIndex
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, List, Sequence, Type
+from core.models.base_class import Base
+from core.models.models import STMT_INSERT, insert_execution_options
+from core.cache.events import invalidate_on_commit
+
+
+COPY_THRESHOLD = 100 #С какого количества строк вставка идет через COPY вместо INSERT
+
+
+def _fill_defaults(model: Type[Base], rows: List[dict[str, Any]]) -> List[dict[str, Any]]:
+    #COPY не вызывает python-дефолты колонок, подставляем их сами
+    defaults = [
+        column for column in model.__table__.columns
+        if column.default is not None and column.computed is None
+    ]
+    filled = []
+    for row in rows:
+        row = dict(row)
+        for column in defaults:
+            if column.key not in row:
+                row[column.key] = column.default.arg(None) if column.default.is_callable else column.default.arg
+        filled.append(row)
+    return filled
+
+async def bulk_copy(session: AsyncSession, model: Type[Base], rows: List[dict[str, Any]]) -> None:
+    # Вставка строк одним COPY через соединение asyncpg текущей сессии.
+    # Колонки берутся из первой строки, все строки должны иметь одинаковый набор ключей
+    rows = _fill_defaults(model, rows)
+    columns = [column for column in model.__table__.columns if column.key in rows[0]]
+
+    #Кодек json/jsonb, который SQLAlchemy ставит на соединение asyncpg, принимает уже сериализованную строку
+    json_columns = {column.key for column in columns if isinstance(column.type, JSON)}
+    records = [
+        tuple(
+            orjson.dumps(row[column.key]).decode()
+            if column.key in json_columns and row[column.key] is not None else row[column.key]
+            for column in columns
+        )
+        for row in rows
+    ]
+    invalidate_on_commit(session, model)
+
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    if not raw.driver_connection.is_in_transaction():
+        # Адаптер asyncpg открывает транзакцию только на первом запросе через курсор.
+        # Без этого COPY первым запросом сессии ушел бы в autocommit и не откатывался с ней
+        await connection.execute(text("SELECT 1"))
+    await raw.driver_connection.copy_records_to_table(
+        model.__tablename__,
+        records = records,
+        columns = [column.name for column in columns],
+    )
+
+async def seed_copy(session: AsyncSession, model: Type[Base], rows: List[dict[str, Any]]) -> None:
+    # Первичная загрузка пустой таблицы (catalog_mediaasset, catalog_section):
+    # вторичные индексы удаляются и строятся один раз после COPY, а не обновляются на каждую строку
+    if not rows:
+        return
+    indexes = [index for index in model.__table__.indexes if not index.unique]
+    invalidate_on_commit(session, model)
+    connection = await session.connection()
+    for index in indexes:
+        await connection.execute(DropIndex(index))
+    await bulk_copy(session, model, rows)
+    for index in indexes:
+        await connection.execute(CreateIndex(index))
+
+async def bulk_insert(session: AsyncSession, model: Type[Base], rows: List[dict[str, Any]]) -> None:
+    #Небольшие пачки вставляются обычным executemany, большие через COPY
+    if not rows:
+        return
+    invalidate_on_commit(session, model)
+    if len(rows) >= COPY_THRESHOLD:
+        await bulk_copy(session, model, rows)
+    else:
+        stmt = STMT_INSERT[model] if model in STMT_INSERT else insert(model).execution_options(**insert_execution_options(model))
+        await session.execute(stmt, rows)
+
+async def bulk_insert_returning(session: AsyncSession, model: Type[Base], rows: List[dict[str, Any]]) -> List[int]:
+    # Вставка с возвратом id в порядке переданных строк.
+    # SQLAlchemy сам режет executemany на multi-row INSERT ... RETURNING пачки
+    # по insertmanyvalues_page_size и в пределах лимита параметров asyncpg
+    if not rows:
+        return []
+    invalidate_on_commit(session, model)
+    stmt = (
+        insert(model)
+        .returning(model.id, sort_by_parameter_order = True)
+        .execution_options(**insert_execution_options(model))
+    )
+    executed = await session.execute(stmt, rows)
+    return list(executed.scalars().all())
+
+async def bulk_upsert(
+        session: AsyncSession,
+        model: Type[Base],
+        rows: List[dict[str, Any]],
+        index_elements: Sequence[str] = ("id",), #Колонки уникального индекса, по которому ищется конфликт
+    ) -> None:
+    # INSERT ... ON CONFLICT DO UPDATE одним executemany вместо SELECT и отдельных INSERT/UPDATE.
+    # Обновляются переданные колонки, updated_at проставляет PostgreSQL
+    if not rows:
+        return
+    invalidate_on_commit(session, model)
+    stmt = pg_insert(model)
+    set_ = {key: stmt.excluded[key] for key in rows[0] if key not in index_elements}
+    if "updated_at" in model.__table__.columns:
+        set_["updated_at"] = func.now()
+    stmt = (
+        stmt.on_conflict_do_update(index_elements = list(index_elements), set_ = set_)
+        .execution_options(**insert_execution_options(model))
+    )
+    await session.execute(stmt, rows)
+
@@ -1,6 +1,39 @@
+import orjson
+from uuid import uuid4
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+from sqlalchemy import event
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS, CACHING_DISABLED, NO_CACHE_KEY, NO_DIALECT_SUPPORT
 from typing import AsyncGenerator
-from core.config import settings
+from functools import lru_cache
+from core.config import get_settings
+from core.cache.events import CacheInvalidatingSession
+from core.utils.logger import logger as log
+
+def _orjson_dumps(value) -> str:
+    return orjson.dumps(value).decode()
+
+def _unique_prepared_statement_name() -> str:
+    #Уникальное имя не пересекается с выражениями, оставшимися на серверном соединении PgBouncer
+    return f"__asyncpg_{uuid4()}__"
+
+CACHE_STATUS_NAMES = {
+    CACHE_MISS: "miss",
+    CACHING_DISABLED: "caching disabled",
+    NO_CACHE_KEY: "no cache key",
+    NO_DIALECT_SUPPORT: "no dialect support",
+}
+
+def _log_compiled_cache_miss(conn, cursor, statement, parameters, context, executemany):
+    #Запрос, который не взят из кэша скомпилированных выражений, снова проходит компиляцию
+    if context.compiled is not None and context.cache_hit != CACHE_HIT:
+        log.debug(
+            "SQL compiled cache %s; pool: %s; %.80s",
+            CACHE_STATUS_NAMES.get(context.cache_hit, context.cache_hit),
+            conn.engine.pool.status(),
+            statement,
+        )
+
 
 class DatabaseHelper:
     def __init__(
@@ -10,20 +43,61 @@ class DatabaseHelper:
             echo_pool: bool = False, #Вывод логов соединения с бд в консоль
             pool_size: int = 5, #Макс кол-во постоянных соединений, которые будут поддерживаться в пуле
             max_overflow: int = 10, #Макс кол-во временных соединений
+            pool_pre_ping: bool = True, #Проверка соединения перед выдачей из пула
+            pool_recycle: int = 1800, #Через сколько секунд пересоздавать соединение
+            pool_use_lifo: bool = True, #Выдавать последнее возвращенное соединение, лишние простаивают и закрываются по pool_recycle
+            statement_cache_size: int = 1024, #Размер кэша подготовленных выражений asyncpg на соединение
+            prepared_statement_cache_size: int = 512, #Размер кэша подготовленных выражений на стороне SQLAlchemy
+            use_pgbouncer: bool = False, #Перед бд стоит PgBouncer в режиме transaction
+            query_cache_size: int = 1200, #Размер кэша скомпилированных SQL-выражений SQLAlchemy
+            insertmanyvalues_page_size: int = 1000, #Сколько строк уходит в один multi-row INSERT
         ) -> None:
+            if use_pgbouncer:
+                # Пулом управляет PgBouncer, а подготовленные выражения
+                # не переживают смену серверного соединения между транзакциями
+                pool_kwargs = {"poolclass": NullPool}
+                statement_cache_size = 0
+                prepared_statement_cache_size = 0
+                connect_args = {"prepared_statement_name_func": _unique_prepared_statement_name}
+            else:
+                pool_kwargs = {
+                    "poolclass": AsyncAdaptedQueuePool,
+                    "pool_use_lifo": pool_use_lifo,
+                    "pool_size": pool_size,
+                    "max_overflow": max_overflow,
+                    "pool_pre_ping": pool_pre_ping,
+                    "pool_recycle": pool_recycle,
+                }
+                connect_args = {}
+
             self.engine: AsyncEngine = create_async_engine(
                 url = url,
                 echo = echo,
                 echo_pool = echo_pool,
-                pool_size = pool_size,
-                max_overflow = max_overflow,
+                query_cache_size = query_cache_size,
+                insertmanyvalues_page_size = insertmanyvalues_page_size,
+                #JSON/JSONB колонки кодируются и разбираются через orjson вместо stdlib json
+                json_serializer = _orjson_dumps,
+                json_deserializer = orjson.loads,
+                connect_args = {
+                    "statement_cache_size": statement_cache_size,
+                    "prepared_statement_cache_size": prepared_statement_cache_size,
+                    **connect_args,
+                },
+                **pool_kwargs,
             )
+            #Без поддержки диалектом SQLAlchemy молча компилирует каждый запрос заново
+            if not self.engine.dialect.supports_statement_cache:
+                raise RuntimeError(f"Dialect {self.engine.dialect.name} does not support SQL compiled cache")
+            if echo:
+                event.listen(self.engine.sync_engine, "after_cursor_execute", _log_compiled_cache_miss)
 
             self.session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
                   bind = self.engine,
                   autoflush = False,
                   autocommit = False,
-                  expire_on_commit = False
+                  expire_on_commit = False,
+                  sync_session_class = CacheInvalidatingSession
             )
 
     async def dispose(self) -> None:
@@ -34,11 +108,25 @@ class DatabaseHelper:
              yield session
 
 
-db_helper = DatabaseHelper(
-     url = settings.db.DB_URL,
-     echo = settings.db.echo,
-     echo_pool = settings.db.echo_pool,
-     pool_size = settings.db.pool_size,
-     max_overflow = settings.db.max_overflow
-)
-    
+@lru_cache(maxsize=1)
+def get_db_helper() -> DatabaseHelper:
+    #Один движок и один пул соединений на процесс
+    settings = get_settings()
+    return DatabaseHelper(
+        url = settings.db.DB_URL,
+        echo = settings.db.echo,
+        echo_pool = settings.db.echo_pool,
+        pool_size = settings.db.pool_size,
+        max_overflow = settings.db.max_overflow,
+        pool_pre_ping = settings.db.pool_pre_ping,
+        pool_recycle = settings.db.pool_recycle,
+        pool_use_lifo = settings.db.pool_use_lifo,
+        statement_cache_size = settings.db.statement_cache_size,
+        prepared_statement_cache_size = settings.db.prepared_statement_cache_size,
+        use_pgbouncer = settings.db.use_pgbouncer,
+        query_cache_size = settings.db.query_cache_size,
+        insertmanyvalues_page_size = settings.db.insertmanyvalues_page_size
+    )
+
+
+db_helper = get_db_helper()
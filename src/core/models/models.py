@@ -1,12 +1,34 @@
 from typing import List, Optional
 
-from sqlalchemy import ARRAY, BigInteger, Boolean, CheckConstraint, DateTime, ForeignKeyConstraint, Identity, Index, Integer, JSON, Numeric, PrimaryKeyConstraint, SmallInteger, String, Text, UniqueConstraint
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import DeclarativeBase, Mapped, MappedAsDataclass, mapped_column, relationship
-import decimal
-from datetime import UTC, datetime
+from sqlalchemy import ARRAY, BigInteger, Boolean, CheckConstraint, Computed, DateTime, ForeignKeyConstraint, Identity, Index, Integer, Numeric, PrimaryKeyConstraint, SmallInteger, String, Text, UniqueConstraint, bindparam, func, insert, select, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, MappedColumn, WriteOnlyMapped, mapped_column, relationship
+import uuid
+from datetime import datetime
 
 from core.models.base_class import Base
+from core.config import settings
+
+
+# Временные метки проставляет PostgreSQL, updated_at обновляется в том же UPDATE
+def created_at_column() -> MappedColumn[datetime]:
+    return mapped_column(DateTime(timezone=True), server_default=func.now())
+
+def updated_at_column() -> MappedColumn[datetime]:
+    return mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+# Итоговая цена стратегии, считается PostgreSQL при записи строки (GENERATED ... STORED)
+PRICING_SUM_SQL = (
+    "round(("
+    "coalesce((parameters #>> '{parameters,pricePerMeter}')::numeric, 0)"
+    " * ((coalesce((parameters #>> '{parameters,marginPct}')::numeric, 0) + 100) / 100)"
+    " + coalesce((parameters #>> '{parameters,extras,ottomanFlat,count}')::numeric, 0)"
+    " * coalesce((parameters #>> '{parameters,extras,ottomanFlat,price}')::numeric, 0)"
+    " + coalesce((parameters #>> '{parameters,extras,mechanismFlat,count}')::numeric, 0)"
+    " * coalesce((parameters #>> '{parameters,extras,mechanismFlat,price}')::numeric, 0)"
+    ") * ((coalesce((parameters #>> '{parameters,fabricPct,category}')::numeric, 0) + 100) / 100), 2)"
+)
 
 
 class AdminSession(Base):
@@ -14,22 +36,21 @@ class AdminSession(Base):
     __table_args__ = (
         PrimaryKeyConstraint('id', name='admin_session_pkey'),
         Index('ix_admin_session_session_id', 'session_id', unique=True),
-        Index('ix_admin_session_user_id', 'user_id')
+        Index('ix_admin_session_user_id', 'user_id'),
+        Index('ix_admin_session_active_user', 'user_id', postgresql_where=text('is_active')),
+        {'info': {'insertmanyvalues_page_size': 250}}
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(Integer)
-    session_id: Mapped[str] = mapped_column(String(36))
+    session_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True))
     ip_address: Mapped[str] = mapped_column(String(45))
     user_agent: Mapped[str] = mapped_column(String(512))
-    device_info: Mapped[dict] = mapped_column(JSON)
-    created_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            default=datetime.now(UTC),
-        )
+    device_info: Mapped[dict] = mapped_column(JSONB)
+    created_at: Mapped[datetime] = created_at_column()
     last_activity: Mapped[datetime] = mapped_column(DateTime(True))
     is_active: Mapped[bool] = mapped_column(Boolean)
-    session_metadata: Mapped[dict] = mapped_column(JSON)
+    session_metadata: Mapped[dict] = mapped_column(JSONB)
 
 
 class AdminUser(Base):
@@ -42,16 +63,9 @@ class AdminUser(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     username: Mapped[str] = mapped_column(String(20))
     hashed_password: Mapped[str] = mapped_column(String)
-    created_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            default=datetime.now(UTC),
-        )
+    created_at: Mapped[datetime] = created_at_column()
     is_superuser: Mapped[bool] = mapped_column(Boolean)
-    updated_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            onupdate=datetime.now(UTC), 
-            default=datetime.now(UTC),
-        )
+    updated_at: Mapped[datetime] = updated_at_column()
 
 
 class AuthGroup(Base):
@@ -65,8 +79,8 @@ class AuthGroup(Base):
     id: Mapped[int] = mapped_column(Integer, Identity(start=1, increment=1, minvalue=1, maxvalue=2147483647, cycle=False, cache=1), primary_key=True)
     name: Mapped[str] = mapped_column(String(150))
 
-    auth_user_groups: Mapped[List['AuthUserGroups']] = relationship('AuthUserGroups', back_populates='group')
-    auth_group_permissions: Mapped[List['AuthGroupPermissions']] = relationship('AuthGroupPermissions', back_populates='group')
+    auth_user_groups: Mapped[List['AuthUserGroups']] = relationship('AuthUserGroups', back_populates='group', lazy=settings.db.lazy)
+    auth_group_permissions: Mapped[List['AuthGroupPermissions']] = relationship('AuthGroupPermissions', back_populates='group', lazy=settings.db.lazy)
 
 
 class AuthUser(Base):
@@ -74,7 +88,8 @@ class AuthUser(Base):
     __table_args__ = (
         PrimaryKeyConstraint('id', name='auth_user_pkey'),
         UniqueConstraint('username', name='auth_user_username_key'),
-        Index('auth_user_username_6821ab7c_like', 'username')
+        Index('auth_user_username_6821ab7c_like', 'username'),
+        Index('ix_auth_user_active_username', 'username', postgresql_where=text('is_active'))
     )
 
     id: Mapped[int] = mapped_column(Integer, Identity(start=1, increment=1, minvalue=1, maxvalue=2147483647, cycle=False, cache=1), primary_key=True)
@@ -89,9 +104,9 @@ class AuthUser(Base):
     date_joined: Mapped[datetime] = mapped_column(DateTime(True))
     last_login: Mapped[Optional[datetime]] = mapped_column(DateTime(True))
 
-    auth_user_groups: Mapped[List['AuthUserGroups']] = relationship('AuthUserGroups', back_populates='user')
-    django_admin_log: Mapped[List['DjangoAdminLog']] = relationship('DjangoAdminLog', back_populates='user')
-    auth_user_user_permissions: Mapped[List['AuthUserUserPermissions']] = relationship('AuthUserUserPermissions', back_populates='user')
+    auth_user_groups: Mapped[List['AuthUserGroups']] = relationship('AuthUserGroups', back_populates='user', lazy=settings.db.lazy)
+    django_admin_log: Mapped[List['DjangoAdminLog']] = relationship('DjangoAdminLog', back_populates='user', lazy=settings.db.lazy)
+    auth_user_user_permissions: Mapped[List['AuthUserUserPermissions']] = relationship('AuthUserUserPermissions', back_populates='user', lazy=settings.db.lazy)
 
 
 class ClassificationFunctionalcategory(Base):
@@ -100,19 +115,12 @@ class ClassificationFunctionalcategory(Base):
         PrimaryKeyConstraint('id', name='classification_functionalcategory_pk'),
     )
 
-    created_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            default=datetime.now(UTC),
-        )
-    updated_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            onupdate=datetime.now(UTC), 
-            default=datetime.now(UTC),
-        )
+    created_at: Mapped[datetime] = created_at_column()
+    updated_at: Mapped[datetime] = updated_at_column()
     label: Mapped[str] = mapped_column(String(120))
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
-    classification_functionalcategory_categories: Mapped['ClassificationFunctionalcategoryCategories'] = relationship('ClassificationFunctionalcategoryCategories', uselist=False, back_populates='functionalcategory')
+    classification_functionalcategory_categories: Mapped['ClassificationFunctionalcategoryCategories'] = relationship('ClassificationFunctionalcategoryCategories', uselist=False, back_populates='functionalcategory', lazy=settings.db.lazy)
 
 
 class ClassificationGroup(Base):
@@ -121,19 +129,12 @@ class ClassificationGroup(Base):
         PrimaryKeyConstraint('id', name='classification_group_pk'),
     )
 
-    created_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            default=datetime.now(UTC),
-        )
-    updated_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            onupdate=datetime.now(UTC), 
-            default=datetime.now(UTC),
-        )
+    created_at: Mapped[datetime] = created_at_column()
+    updated_at: Mapped[datetime] = updated_at_column()
     label: Mapped[str] = mapped_column(String(120))
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
-    classification_category: Mapped[List['ClassificationCategory']] = relationship('ClassificationCategory', back_populates='group')
+    classification_category: Mapped[List['ClassificationCategory']] = relationship('ClassificationCategory', back_populates='group', lazy='selectin')
 
 
 class DjangoContentType(Base):
@@ -147,8 +148,8 @@ class DjangoContentType(Base):
     app_label: Mapped[str] = mapped_column(String(100))
     model: Mapped[str] = mapped_column(String(100))
 
-    auth_permission: Mapped[List['AuthPermission']] = relationship('AuthPermission', back_populates='content_type')
-    django_admin_log: Mapped[List['DjangoAdminLog']] = relationship('DjangoAdminLog', back_populates='content_type')
+    auth_permission: Mapped[List['AuthPermission']] = relationship('AuthPermission', back_populates='content_type', lazy=settings.db.lazy)
+    django_admin_log: Mapped[List['DjangoAdminLog']] = relationship('DjangoAdminLog', back_populates='content_type', lazy=settings.db.lazy)
 
 
 class DjangoMigrations(Base):
@@ -168,7 +169,9 @@ class DjangoSession(Base):
     __table_args__ = (
         PrimaryKeyConstraint('session_key', name='django_session_pkey'),
         Index('django_session_expire_date_a5c62663', 'expire_date'),
-        Index('django_session_session_key_c0390e0f_like', 'session_key')
+        Index('django_session_session_key_c0390e0f_like', 'session_key'),
+        Index('django_session_session_key_hash', 'session_key', postgresql_using='hash'),
+        {'info': {'insertmanyvalues_page_size': 250}}
     )
 
     session_key: Mapped[str] = mapped_column(String(40), primary_key=True)
@@ -180,22 +183,17 @@ class PricingPricingstrategy(Base):
     __tablename__ = 'pricing_pricingstrategy'
     __table_args__ = (
         PrimaryKeyConstraint('id', name='pricing_pricingstrategy_pk'),
+        Index('ix_pricing_parameters_gin', 'parameters', postgresql_using='gin')
     )
 
-    created_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            default=datetime.now(UTC),
-        )
-    updated_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            onupdate=datetime.now(UTC), 
-            default=datetime.now(UTC),
-        )
+    created_at: Mapped[datetime] = created_at_column()
+    updated_at: Mapped[datetime] = updated_at_column()
     engine: Mapped[str] = mapped_column(String(120))
     parameters: Mapped[dict] = mapped_column(JSONB)
+    computed_sum: Mapped[Optional[float]] = mapped_column(Numeric(12, 2, asdecimal=False), Computed(PRICING_SUM_SQL, persisted=True))
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
-    catalog_collection: Mapped[List['CatalogCollection']] = relationship('CatalogCollection', back_populates='pricing_strategy')
+    catalog_collection: Mapped[List['CatalogCollection']] = relationship('CatalogCollection', back_populates='pricing_strategy', lazy=settings.db.lazy)
 
 
 class ReferenceEnumgroup(Base):
@@ -204,19 +202,12 @@ class ReferenceEnumgroup(Base):
         PrimaryKeyConstraint('id', name='reference_enumgroup_pk'),
     )
 
-    created_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            default=datetime.now(UTC),
-        )
-    updated_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            onupdate=datetime.now(UTC), 
-            default=datetime.now(UTC),
-        )
+    created_at: Mapped[datetime] = created_at_column()
+    updated_at: Mapped[datetime] = updated_at_column()
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
-    reference_enumentry: Mapped[List['ReferenceEnumentry']] = relationship('ReferenceEnumentry', back_populates='group')
-    configurator_optiondefinition: Mapped[List['ConfiguratorOptiondefinition']] = relationship('ConfiguratorOptiondefinition', back_populates='dict_group')
+    reference_enumentry: Mapped[List['ReferenceEnumentry']] = relationship('ReferenceEnumentry', back_populates='group', lazy='selectin')
+    configurator_optiondefinition: Mapped[List['ConfiguratorOptiondefinition']] = relationship('ConfiguratorOptiondefinition', back_populates='dict_group', lazy=settings.db.lazy)
 
 
 class ReferenceUnitofmeasure(Base):
@@ -224,18 +215,10 @@ class ReferenceUnitofmeasure(Base):
     __table_args__ = (
         CheckConstraint('"precision" >= 0', name='reference_unitofmeasure_precision_check'),
         PrimaryKeyConstraint('id', name='reference_unitofmeasure_pkey'),
-        Index('reference_unitofmeasure_id_ad4f0d6e_like', 'id')
     )
 
-    created_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            default=datetime.now(UTC),
-        )
-    updated_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            onupdate=datetime.now(UTC), 
-            default=datetime.now(UTC),
-        )
+    created_at: Mapped[datetime] = created_at_column()
+    updated_at: Mapped[datetime] = updated_at_column()
     id: Mapped[str] = mapped_column(String(20), primary_key=True)
     precision: Mapped[int] = mapped_column(SmallInteger)
 
@@ -254,9 +237,9 @@ class AuthPermission(Base):
     content_type_id: Mapped[int] = mapped_column(Integer)
     codename: Mapped[str] = mapped_column(String(100))
 
-    content_type: Mapped['DjangoContentType'] = relationship('DjangoContentType', back_populates='auth_permission')
-    auth_group_permissions: Mapped[List['AuthGroupPermissions']] = relationship('AuthGroupPermissions', back_populates='permission')
-    auth_user_user_permissions: Mapped[List['AuthUserUserPermissions']] = relationship('AuthUserUserPermissions', back_populates='permission')
+    content_type: Mapped['DjangoContentType'] = relationship('DjangoContentType', back_populates='auth_permission', lazy='joined')
+    auth_group_permissions: Mapped[List['AuthGroupPermissions']] = relationship('AuthGroupPermissions', back_populates='permission', lazy=settings.db.lazy)
+    auth_user_user_permissions: Mapped[List['AuthUserUserPermissions']] = relationship('AuthUserUserPermissions', back_populates='permission', lazy=settings.db.lazy)
 
 
 class AuthUserGroups(Base):
@@ -267,15 +250,16 @@ class AuthUserGroups(Base):
         PrimaryKeyConstraint('id', name='auth_user_groups_pkey'),
         UniqueConstraint('user_id', 'group_id', name='auth_user_groups_user_id_group_id_94350c0c_uniq'),
         Index('auth_user_groups_group_id_97559544', 'group_id'),
-        Index('auth_user_groups_user_id_6a12ed8b', 'user_id')
+        Index('auth_user_groups_user_id_6a12ed8b', 'user_id'),
+        {'info': {'insertmanyvalues_page_size': 5000}}
     )
 
-    id: Mapped[int] = mapped_column(BigInteger, Identity(start=1, increment=1, minvalue=1, maxvalue=9223372036854775807, cycle=False, cache=1), primary_key=True)
+    id: Mapped[int] = mapped_column(BigInteger, Identity(start=1, increment=1, minvalue=1, maxvalue=9223372036854775807, cycle=False, cache=50), primary_key=True)
     user_id: Mapped[int] = mapped_column(Integer)
     group_id: Mapped[int] = mapped_column(Integer)
 
-    group: Mapped['AuthGroup'] = relationship('AuthGroup', back_populates='auth_user_groups')
-    user: Mapped['AuthUser'] = relationship('AuthUser', back_populates='auth_user_groups')
+    group: Mapped['AuthGroup'] = relationship('AuthGroup', back_populates='auth_user_groups', lazy=settings.db.lazy)
+    user: Mapped['AuthUser'] = relationship('AuthUser', back_populates='auth_user_groups', lazy=settings.db.lazy)
 
 
 class ClassificationCategory(Base):
@@ -286,24 +270,17 @@ class ClassificationCategory(Base):
         Index('classification_category_group_idx', 'group_id')
     )
 
-    created_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            default=datetime.now(UTC),
-        )
-    updated_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            onupdate=datetime.now(UTC), 
-            default=datetime.now(UTC),
-        )
+    created_at: Mapped[datetime] = created_at_column()
+    updated_at: Mapped[datetime] = updated_at_column()
     label: Mapped[str] = mapped_column(String(120))
     group_id: Mapped[int] = mapped_column(Integer)
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
-    group: Mapped['ClassificationGroup'] = relationship('ClassificationGroup', back_populates='classification_category')
-    classification_functionalcategory_categories: Mapped[List['ClassificationFunctionalcategoryCategories']] = relationship('ClassificationFunctionalcategoryCategories', back_populates='category')
-    classification_subcategory: Mapped[List['ClassificationSubcategory']] = relationship('ClassificationSubcategory', back_populates='category')
-    configurator_configuratortemplate: Mapped[List['ConfiguratorConfiguratortemplate']] = relationship('ConfiguratorConfiguratortemplate', back_populates='category')
-    catalog_collection: Mapped[List['CatalogCollection']] = relationship('CatalogCollection', back_populates='category')
+    group: Mapped['ClassificationGroup'] = relationship('ClassificationGroup', back_populates='classification_category', lazy=settings.db.lazy)
+    classification_functionalcategory_categories: Mapped[List['ClassificationFunctionalcategoryCategories']] = relationship('ClassificationFunctionalcategoryCategories', back_populates='category', lazy=settings.db.lazy)
+    classification_subcategory: Mapped[List['ClassificationSubcategory']] = relationship('ClassificationSubcategory', back_populates='category', lazy=settings.db.lazy)
+    configurator_configuratortemplate: Mapped[List['ConfiguratorConfiguratortemplate']] = relationship('ConfiguratorConfiguratortemplate', back_populates='category', lazy=settings.db.lazy)
+    catalog_collection: Mapped[List['CatalogCollection']] = relationship('CatalogCollection', back_populates='category', lazy=settings.db.lazy)
 
 
 class DjangoAdminLog(Base):
@@ -314,7 +291,8 @@ class DjangoAdminLog(Base):
         ForeignKeyConstraint(['user_id'], ['auth_user.id'], deferrable=True, initially='DEFERRED', name='django_admin_log_user_id_c564eba6_fk_auth_user_id'),
         PrimaryKeyConstraint('id', name='django_admin_log_pkey'),
         Index('django_admin_log_content_type_id_c4bce8eb', 'content_type_id'),
-        Index('django_admin_log_user_id_c564eba6', 'user_id')
+        Index('django_admin_log_user_id_c564eba6', 'user_id'),
+        Index('ix_django_admin_log_object', 'object_id', postgresql_where=text('object_id IS NOT NULL'))
     )
 
     id: Mapped[int] = mapped_column(Integer, Identity(start=1, increment=1, minvalue=1, maxvalue=2147483647, cycle=False, cache=1), primary_key=True)
@@ -326,8 +304,8 @@ class DjangoAdminLog(Base):
     object_id: Mapped[Optional[str]] = mapped_column(Text)
     content_type_id: Mapped[Optional[int]] = mapped_column(Integer)
 
-    content_type: Mapped[Optional['DjangoContentType']] = relationship('DjangoContentType', back_populates='django_admin_log')
-    user: Mapped['AuthUser'] = relationship('AuthUser', back_populates='django_admin_log')
+    content_type: Mapped[Optional['DjangoContentType']] = relationship('DjangoContentType', back_populates='django_admin_log', lazy=settings.db.lazy)
+    user: Mapped['AuthUser'] = relationship('AuthUser', back_populates='django_admin_log', lazy=settings.db.lazy)
 
 
 class ReferenceEnumentry(Base):
@@ -336,25 +314,19 @@ class ReferenceEnumentry(Base):
         CheckConstraint('pct >= 0', name='reference_enumentry_pct_check'),
         ForeignKeyConstraint(['group_id'], ['reference_enumgroup.id'], ondelete='RESTRICT', onupdate='CASCADE', name='reference_enumentry_reference_enumgroup_fk'),
         PrimaryKeyConstraint('id', name='reference_enumentry_pk'),
-        Index('reference_enumentry_dict_group_group_idx', 'group_id')
+        Index('reference_enumentry_dict_group_group_idx', 'group_id'),
+        Index('reference_enumentry_group_pct_idx', 'group_id', 'pct')
     )
 
-    created_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            default=datetime.now(UTC),
-        )
-    updated_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            onupdate=datetime.now(UTC), 
-            default=datetime.now(UTC),
-        )
+    created_at: Mapped[datetime] = created_at_column()
+    updated_at: Mapped[datetime] = updated_at_column()
     label: Mapped[str] = mapped_column(String(120))
-    extra_price: Mapped[decimal.Decimal] = mapped_column(Numeric(9, 2))
+    extra_price: Mapped[float] = mapped_column(Numeric(9, 2, asdecimal=False))
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     group_id: Mapped[int] = mapped_column(Integer)
     pct: Mapped[Optional[int]] = mapped_column(SmallInteger)
 
-    group: Mapped['ReferenceEnumgroup'] = relationship('ReferenceEnumgroup', back_populates='reference_enumentry')
+    group: Mapped['ReferenceEnumgroup'] = relationship('ReferenceEnumgroup', back_populates='reference_enumentry', lazy=settings.db.lazy)
 
 
 class AuthGroupPermissions(Base):
@@ -365,15 +337,16 @@ class AuthGroupPermissions(Base):
         PrimaryKeyConstraint('id', name='auth_group_permissions_pkey'),
         UniqueConstraint('group_id', 'permission_id', name='auth_group_permissions_group_id_permission_id_0cd325b0_uniq'),
         Index('auth_group_permissions_group_id_b120cbf9', 'group_id'),
-        Index('auth_group_permissions_permission_id_84c5c92e', 'permission_id')
+        Index('auth_group_permissions_permission_id_84c5c92e', 'permission_id'),
+        {'info': {'insertmanyvalues_page_size': 5000}}
     )
 
-    id: Mapped[int] = mapped_column(BigInteger, Identity(start=1, increment=1, minvalue=1, maxvalue=9223372036854775807, cycle=False, cache=1), primary_key=True)
+    id: Mapped[int] = mapped_column(BigInteger, Identity(start=1, increment=1, minvalue=1, maxvalue=9223372036854775807, cycle=False, cache=50), primary_key=True)
     group_id: Mapped[int] = mapped_column(Integer)
     permission_id: Mapped[int] = mapped_column(Integer)
 
-    group: Mapped['AuthGroup'] = relationship('AuthGroup', back_populates='auth_group_permissions')
-    permission: Mapped['AuthPermission'] = relationship('AuthPermission', back_populates='auth_group_permissions')
+    group: Mapped['AuthGroup'] = relationship('AuthGroup', back_populates='auth_group_permissions', lazy=settings.db.lazy)
+    permission: Mapped['AuthPermission'] = relationship('AuthPermission', back_populates='auth_group_permissions', lazy=settings.db.lazy)
 
 
 class AuthUserUserPermissions(Base):
@@ -384,15 +357,16 @@ class AuthUserUserPermissions(Base):
         PrimaryKeyConstraint('id', name='auth_user_user_permissions_pkey'),
         UniqueConstraint('user_id', 'permission_id', name='auth_user_user_permissions_user_id_permission_id_14a6b632_uniq'),
         Index('auth_user_user_permissions_permission_id_1fbb5f2c', 'permission_id'),
-        Index('auth_user_user_permissions_user_id_a95ead1b', 'user_id')
+        Index('auth_user_user_permissions_user_id_a95ead1b', 'user_id'),
+        {'info': {'insertmanyvalues_page_size': 5000}}
     )
 
-    id: Mapped[int] = mapped_column(BigInteger, Identity(start=1, increment=1, minvalue=1, maxvalue=9223372036854775807, cycle=False, cache=1), primary_key=True)
+    id: Mapped[int] = mapped_column(BigInteger, Identity(start=1, increment=1, minvalue=1, maxvalue=9223372036854775807, cycle=False, cache=50), primary_key=True)
     user_id: Mapped[int] = mapped_column(Integer)
     permission_id: Mapped[int] = mapped_column(Integer)
 
-    permission: Mapped['AuthPermission'] = relationship('AuthPermission', back_populates='auth_user_user_permissions')
-    user: Mapped['AuthUser'] = relationship('AuthUser', back_populates='auth_user_user_permissions')
+    permission: Mapped['AuthPermission'] = relationship('AuthPermission', back_populates='auth_user_user_permissions', lazy=settings.db.lazy)
+    user: Mapped['AuthUser'] = relationship('AuthUser', back_populates='auth_user_user_permissions', lazy=settings.db.lazy)
 
 
 class ClassificationFunctionalcategoryCategories(Base):
@@ -402,16 +376,15 @@ class ClassificationFunctionalcategoryCategories(Base):
         ForeignKeyConstraint(['functionalcategory_id'], ['classification_functionalcategory.id'], ondelete='RESTRICT', onupdate='CASCADE', name='classification_functionalcategory_categories_classification_fun'),
         PrimaryKeyConstraint('id', name='classification_functionalcategory_categories_pk'),
         UniqueConstraint('functionalcategory_id', name='classification_functionalcategory_categories_unique'),
-        Index('classification_functionalcategory_category_group_idx', 'category_id'),
-        Index('classification_functionalcategory_funccat_group_idx', 'functionalcategory_id')
+        Index('classification_functionalcategory_category_group_idx', 'category_id')
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     functionalcategory_id: Mapped[int] = mapped_column(Integer)
     category_id: Mapped[int] = mapped_column(Integer)
 
-    category: Mapped['ClassificationCategory'] = relationship('ClassificationCategory', back_populates='classification_functionalcategory_categories')
-    functionalcategory: Mapped['ClassificationFunctionalcategory'] = relationship('ClassificationFunctionalcategory', back_populates='classification_functionalcategory_categories')
+    category: Mapped['ClassificationCategory'] = relationship('ClassificationCategory', back_populates='classification_functionalcategory_categories', lazy=settings.db.lazy)
+    functionalcategory: Mapped['ClassificationFunctionalcategory'] = relationship('ClassificationFunctionalcategory', back_populates='classification_functionalcategory_categories', lazy=settings.db.lazy)
 
 
 class ClassificationSubcategory(Base):
@@ -422,22 +395,15 @@ class ClassificationSubcategory(Base):
         Index('classification_subcategory_category_idx', 'category_id')
     )
 
-    created_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            default=datetime.now(UTC),
-        )
-    updated_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            onupdate=datetime.now(UTC), 
-            default=datetime.now(UTC),
-        )
+    created_at: Mapped[datetime] = created_at_column()
+    updated_at: Mapped[datetime] = updated_at_column()
     label: Mapped[str] = mapped_column(String(120))
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     category_id: Mapped[int] = mapped_column(Integer)
 
-    category: Mapped['ClassificationCategory'] = relationship('ClassificationCategory', back_populates='classification_subcategory')
-    catalog_product: Mapped[List['CatalogProduct']] = relationship('CatalogProduct', back_populates='subcategory')
-    catalog_configuration: Mapped[List['CatalogConfiguration']] = relationship('CatalogConfiguration', back_populates='subcategory')
+    category: Mapped['ClassificationCategory'] = relationship('ClassificationCategory', back_populates='classification_subcategory', lazy=settings.db.lazy)
+    catalog_product: Mapped[List['CatalogProduct']] = relationship('CatalogProduct', back_populates='subcategory', lazy=settings.db.lazy)
+    catalog_configuration: Mapped[List['CatalogConfiguration']] = relationship('CatalogConfiguration', back_populates='subcategory', lazy=settings.db.lazy)
 
 
 class ConfiguratorConfiguratortemplate(Base):
@@ -445,28 +411,22 @@ class ConfiguratorConfiguratortemplate(Base):
     __table_args__ = (
         ForeignKeyConstraint(['category_id'], ['classification_category.id'], ondelete='RESTRICT', onupdate='CASCADE', name='configurator_configuratortemplate_classification_category_fk'),
         PrimaryKeyConstraint('id', name='configurator_configuratortemplate_pk'),
-        Index('configurator_configuratortemplate_category_group_idx', 'category_id')
+        Index('configurator_configuratortemplate_category_group_idx', 'category_id'),
+        Index('ix_configuratortemplate_compatible_subcategories_gin', 'compatible_subcategories', postgresql_using='gin')
     )
 
-    created_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            default=datetime.now(UTC),
-        )
-    updated_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            onupdate=datetime.now(UTC), 
-            default=datetime.now(UTC),
-        )
+    created_at: Mapped[datetime] = created_at_column()
+    updated_at: Mapped[datetime] = updated_at_column()
     label: Mapped[str] = mapped_column(String(120))
     compatible_subcategories: Mapped[list] = mapped_column(ARRAY(String(length=30)))
     constraint_dsl: Mapped[dict] = mapped_column(JSONB)
     category_id: Mapped[int] = mapped_column(Integer)
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
-    category: Mapped['ClassificationCategory'] = relationship('ClassificationCategory', back_populates='configurator_configuratortemplate')
-    catalog_collection: Mapped[List['CatalogCollection']] = relationship('CatalogCollection', back_populates='template')
-    configurator_moduletype: Mapped['ConfiguratorModuletype'] = relationship('ConfiguratorModuletype', uselist=False, back_populates='template')
-    configurator_optiondefinition: Mapped['ConfiguratorOptiondefinition'] = relationship('ConfiguratorOptiondefinition', uselist=False, back_populates='template')
+    category: Mapped['ClassificationCategory'] = relationship('ClassificationCategory', back_populates='configurator_configuratortemplate', lazy=settings.db.lazy)
+    catalog_collection: Mapped[List['CatalogCollection']] = relationship('CatalogCollection', back_populates='template', lazy=settings.db.lazy)
+    configurator_moduletype: Mapped['ConfiguratorModuletype'] = relationship('ConfiguratorModuletype', uselist=False, back_populates='template', lazy=settings.db.lazy)
+    configurator_optiondefinition: Mapped['ConfiguratorOptiondefinition'] = relationship('ConfiguratorOptiondefinition', uselist=False, back_populates='template', lazy=settings.db.lazy)
 
 
 class CatalogCollection(Base):
@@ -476,20 +436,15 @@ class CatalogCollection(Base):
         ForeignKeyConstraint(['pricing_strategy_id'], ['pricing_pricingstrategy.id'], ondelete='RESTRICT', onupdate='CASCADE', name='catalog_collection_pricing_pricingstrategy_fk'),
         ForeignKeyConstraint(['template_id'], ['configurator_configuratortemplate.id'], ondelete='RESTRICT', onupdate='CASCADE', name='catalog_collection_configurator_configuratortemplate_fk'),
         PrimaryKeyConstraint('id', name='catalog_collection_pk'),
-        Index('catalog_collection_category_idx', 'category_id'),
         Index('catalog_collection_pricing_strategy_idx', 'pricing_strategy_id'),
-        Index('catalog_collection_template_idx', 'template_id')
+        Index('catalog_collection_template_idx', 'template_id'),
+        Index('catalog_collection_category_label_idx', 'category_id', 'label'),
+        Index('ix_catalog_collection_defaults_gin', 'defaults', postgresql_using='gin', postgresql_ops={'defaults': 'jsonb_path_ops'}),
+        {'info': {'cluster_index': 'catalog_collection_category_label_idx'}}
     )
 
-    created_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            default=datetime.now(UTC),
-        )
-    updated_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            onupdate=datetime.now(UTC), 
-            default=datetime.now(UTC),
-        )
+    created_at: Mapped[datetime] = created_at_column()
+    updated_at: Mapped[datetime] = updated_at_column()
     label: Mapped[str] = mapped_column(String(120))
     defaults: Mapped[dict] = mapped_column(JSONB)
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -497,10 +452,10 @@ class CatalogCollection(Base):
     category_id: Mapped[int] = mapped_column(Integer)
     template_id: Mapped[int] = mapped_column(Integer)
 
-    category: Mapped['ClassificationCategory'] = relationship('ClassificationCategory', back_populates='catalog_collection')
-    pricing_strategy: Mapped['PricingPricingstrategy'] = relationship('PricingPricingstrategy', back_populates='catalog_collection')
-    template: Mapped['ConfiguratorConfiguratortemplate'] = relationship('ConfiguratorConfiguratortemplate', back_populates='catalog_collection')
-    catalog_product: Mapped[List['CatalogProduct']] = relationship('CatalogProduct', back_populates='collection')
+    category: Mapped['ClassificationCategory'] = relationship('ClassificationCategory', back_populates='catalog_collection', lazy='joined')
+    pricing_strategy: Mapped['PricingPricingstrategy'] = relationship('PricingPricingstrategy', back_populates='catalog_collection', lazy='joined')
+    template: Mapped['ConfiguratorConfiguratortemplate'] = relationship('ConfiguratorConfiguratortemplate', back_populates='catalog_collection', lazy='joined')
+    catalog_product: Mapped[List['CatalogProduct']] = relationship('CatalogProduct', back_populates='collection', lazy=settings.db.lazy)
 
 
 class ConfiguratorModuletype(Base):
@@ -509,18 +464,11 @@ class ConfiguratorModuletype(Base):
         ForeignKeyConstraint(['template_id'], ['configurator_configuratortemplate.id'], ondelete='RESTRICT', onupdate='CASCADE', name='configurator_moduletype_configurator_configuratortemplate_fk'),
         PrimaryKeyConstraint('id', name='configurator_moduletype_pk'),
         UniqueConstraint('template_id', name='configurator_moduletype_unique'),
-        Index('configurator_moduletype_template_idx', 'template_id')
+        Index('ix_configurator_moduletype_extra_flags_gin', 'extra_flags', postgresql_using='gin')
     )
 
-    created_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            default=datetime.now(UTC),
-        )
-    updated_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            onupdate=datetime.now(UTC), 
-            default=datetime.now(UTC),
-        )
+    created_at: Mapped[datetime] = created_at_column()
+    updated_at: Mapped[datetime] = updated_at_column()
     code: Mapped[str] = mapped_column(String(30))
     shape: Mapped[str] = mapped_column(String(30))
     size_rule: Mapped[dict] = mapped_column(JSONB)
@@ -528,8 +476,8 @@ class ConfiguratorModuletype(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     template_id: Mapped[int] = mapped_column(Integer)
 
-    template: Mapped['ConfiguratorConfiguratortemplate'] = relationship('ConfiguratorConfiguratortemplate', back_populates='configurator_moduletype')
-    catalog_section: Mapped[List['CatalogSection']] = relationship('CatalogSection', back_populates='module_type')
+    template: Mapped['ConfiguratorConfiguratortemplate'] = relationship('ConfiguratorConfiguratortemplate', back_populates='configurator_moduletype', lazy=settings.db.lazy)
+    catalog_section: Mapped[List['CatalogSection']] = relationship('CatalogSection', back_populates='module_type', lazy=settings.db.lazy)
 
 
 class ConfiguratorOptiondefinition(Base):
@@ -540,18 +488,11 @@ class ConfiguratorOptiondefinition(Base):
         PrimaryKeyConstraint('id', name='configurator_optiondefinition_pk'),
         UniqueConstraint('template_id', name='configurator_optiondefinition_unique'),
         Index('configurator_optiondefinition_dict_group_group_idx', 'dict_group_id'),
-        Index('configurator_optiondefinition_template_group_idx', 'template_id')
+        Index('ix_configurator_optiondefinition_roles_gin', 'roles', postgresql_using='gin')
     )
 
-    created_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            default=datetime.now(UTC),
-        )
-    updated_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            onupdate=datetime.now(UTC), 
-            default=datetime.now(UTC),
-        )
+    created_at: Mapped[datetime] = created_at_column()
+    updated_at: Mapped[datetime] = updated_at_column()
     code: Mapped[str] = mapped_column(String(30))
     field_type: Mapped[str] = mapped_column(String(10))
     required: Mapped[bool] = mapped_column(Boolean)
@@ -560,8 +501,8 @@ class ConfiguratorOptiondefinition(Base):
     dict_group_id: Mapped[int] = mapped_column(Integer)
     roles: Mapped[Optional[list]] = mapped_column(ARRAY(String(length=30)))
 
-    dict_group: Mapped['ReferenceEnumgroup'] = relationship('ReferenceEnumgroup', back_populates='configurator_optiondefinition')
-    template: Mapped['ConfiguratorConfiguratortemplate'] = relationship('ConfiguratorConfiguratortemplate', back_populates='configurator_optiondefinition')
+    dict_group: Mapped['ReferenceEnumgroup'] = relationship('ReferenceEnumgroup', back_populates='configurator_optiondefinition', lazy='joined')
+    template: Mapped['ConfiguratorConfiguratortemplate'] = relationship('ConfiguratorConfiguratortemplate', back_populates='configurator_optiondefinition', lazy='joined')
 
 
 class CatalogProduct(Base):
@@ -571,18 +512,14 @@ class CatalogProduct(Base):
         ForeignKeyConstraint(['subcategory_id'], ['classification_subcategory.id'], ondelete='RESTRICT', onupdate='CASCADE', name='catalog_product_classification_subcategory_fk'),
         PrimaryKeyConstraint('id', name='catalog_product_pk'),
         Index('catalog_product_collection_idx', 'collection_id'),
-        Index('catalog_product_subcategory_idx', 'subcategory_id')
+        Index('catalog_product_subcategory_idx', 'subcategory_id'),
+        Index('catalog_product_collection_updated_idx', 'collection_id', 'updated_at', postgresql_include=['label']),
+        Index('catalog_product_attributes_gin', 'attributes', postgresql_using='gin', postgresql_ops={'attributes': 'jsonb_path_ops'}),
+        {'info': {'cluster_index': 'catalog_product_collection_idx'}}
     )
 
-    created_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            default=datetime.now(UTC),
-        )
-    updated_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            onupdate=datetime.now(UTC), 
-            default=datetime.now(UTC),
-        )
+    created_at: Mapped[datetime] = created_at_column()
+    updated_at: Mapped[datetime] = updated_at_column()
     label: Mapped[str] = mapped_column(String(120))
     allowed_section_counts: Mapped[list] = mapped_column(ARRAY(SmallInteger()))
     flags: Mapped[dict] = mapped_column(JSONB)
@@ -591,10 +528,10 @@ class CatalogProduct(Base):
     collection_id: Mapped[int] = mapped_column(Integer)
     subcategory_id: Mapped[Optional[int]] = mapped_column(Integer)
 
-    collection: Mapped['CatalogCollection'] = relationship('CatalogCollection', back_populates='catalog_product')
-    subcategory: Mapped[Optional['ClassificationSubcategory']] = relationship('ClassificationSubcategory', back_populates='catalog_product')
-    catalog_configuration: Mapped[List['CatalogConfiguration']] = relationship('CatalogConfiguration', back_populates='product')
-    catalog_mediaasset: Mapped[List['CatalogMediaasset']] = relationship('CatalogMediaasset', back_populates='product')
+    collection: Mapped['CatalogCollection'] = relationship('CatalogCollection', back_populates='catalog_product', lazy='raise_on_sql')
+    subcategory: Mapped[Optional['ClassificationSubcategory']] = relationship('ClassificationSubcategory', back_populates='catalog_product', lazy='joined')
+    catalog_configuration: WriteOnlyMapped['CatalogConfiguration'] = relationship('CatalogConfiguration', back_populates='product', lazy='write_only')
+    catalog_mediaasset: WriteOnlyMapped['CatalogMediaasset'] = relationship('CatalogMediaasset', back_populates='product', lazy='write_only')
 
 
 class CatalogConfiguration(Base):
@@ -603,28 +540,22 @@ class CatalogConfiguration(Base):
         ForeignKeyConstraint(['product_id'], ['catalog_product.id'], ondelete='RESTRICT', onupdate='CASCADE', name='catalog_configuration_catalog_product_fk'),
         ForeignKeyConstraint(['subcategory_id'], ['classification_subcategory.id'], ondelete='RESTRICT', onupdate='CASCADE', name='catalog_configuration_classification_subcategory_fk'),
         PrimaryKeyConstraint('id', name='catalog_configuration_pk'),
-        Index('catalog_configuration_product_idx', 'product_id'),
-        Index('catalog_configuration_subcat_idx', 'subcategory_id')
+        Index('catalog_configuration_product_covering_idx', 'product_id', 'subcategory_id', postgresql_include=['id', 'label']),
+        Index('catalog_configuration_subcat_idx', 'subcategory_id'),
+        Index('catalog_configuration_created_brin', 'created_at', postgresql_using='brin', postgresql_with={'pages_per_range': 32})
     )
 
-    created_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            default=datetime.now(UTC),
-        )
-    updated_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            onupdate=datetime.now(UTC), 
-            default=datetime.now(UTC),
-        )
+    created_at: Mapped[datetime] = created_at_column()
+    updated_at: Mapped[datetime] = updated_at_column()
     label: Mapped[str] = mapped_column(String(120))
     options_selected: Mapped[dict] = mapped_column(JSONB)
     product_id: Mapped[int] = mapped_column(Integer)
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     subcategory_id: Mapped[int] = mapped_column(Integer)
 
-    product: Mapped['CatalogProduct'] = relationship('CatalogProduct', back_populates='catalog_configuration')
-    subcategory: Mapped['ClassificationSubcategory'] = relationship('ClassificationSubcategory', back_populates='catalog_configuration')
-    catalog_section: Mapped['CatalogSection'] = relationship('CatalogSection', uselist=False, back_populates='configuration')
+    product: Mapped['CatalogProduct'] = relationship('CatalogProduct', back_populates='catalog_configuration', lazy=settings.db.lazy)
+    subcategory: Mapped['ClassificationSubcategory'] = relationship('ClassificationSubcategory', back_populates='catalog_configuration', lazy=settings.db.lazy)
+    catalog_section: Mapped['CatalogSection'] = relationship('CatalogSection', uselist=False, back_populates='configuration', lazy=settings.db.lazy)
 
 
 class CatalogMediaasset(Base):
@@ -632,24 +563,18 @@ class CatalogMediaasset(Base):
     __table_args__ = (
         ForeignKeyConstraint(['product_id'], ['catalog_product.id'], ondelete='RESTRICT', onupdate='CASCADE', name='catalog_mediaasset_catalog_product_fk'),
         PrimaryKeyConstraint('id', name='catalog_mediaasset_pk'),
-        Index('catalog_mediaasset_product_idx', 'product_id')
+        Index('catalog_mediaasset_product_covering_idx', 'product_id', postgresql_include=['url', 'tag']),
+        Index('catalog_mediaasset_created_brin', 'created_at', postgresql_using='brin', postgresql_with={'pages_per_range': 32})
     )
 
-    created_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            default=datetime.now(UTC),
-        )
-    updated_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            onupdate=datetime.now(UTC), 
-            default=datetime.now(UTC),
-        )
+    created_at: Mapped[datetime] = created_at_column()
+    updated_at: Mapped[datetime] = updated_at_column()
     url: Mapped[str] = mapped_column(String(200))
     tag: Mapped[str] = mapped_column(String(30))
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     product_id: Mapped[int] = mapped_column(Integer)
 
-    product: Mapped['CatalogProduct'] = relationship('CatalogProduct', back_populates='catalog_mediaasset')
+    product: Mapped['CatalogProduct'] = relationship('CatalogProduct', back_populates='catalog_mediaasset', lazy=settings.db.lazy)
 
 
 class CatalogSection(Base):
@@ -661,19 +586,13 @@ class CatalogSection(Base):
         ForeignKeyConstraint(['module_type_id'], ['configurator_moduletype.id'], ondelete='RESTRICT', onupdate='CASCADE', name='catalog_section_configurator_moduletype_fk'),
         PrimaryKeyConstraint('id', name='catalog_section_pk'),
         UniqueConstraint('configuration_id', name='catalog_section_unique'),
-        Index('catalog_configuration_idx', 'configuration_id'),
-        Index('catalog_section_module_type_id_2d7d07bb', 'module_type_id')
+        Index('catalog_section_configuration_covering_idx', 'configuration_id', postgresql_include=['index', 'size_cm', 'module_type_id']),
+        Index('catalog_section_module_type_id_2d7d07bb', 'module_type_id'),
+        Index('catalog_section_created_brin', 'created_at', postgresql_using='brin', postgresql_with={'pages_per_range': 32})
     )
 
-    created_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            default=datetime.now(UTC),
-        )
-    updated_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            onupdate=datetime.now(UTC), 
-            default=datetime.now(UTC),
-        )
+    created_at: Mapped[datetime] = created_at_column()
+    updated_at: Mapped[datetime] = updated_at_column()
     index: Mapped[int] = mapped_column(SmallInteger)
     size_cm: Mapped[int] = mapped_column(SmallInteger)
     flags: Mapped[dict] = mapped_column(JSONB)
@@ -681,5 +600,23 @@ class CatalogSection(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     configuration_id: Mapped[int] = mapped_column(Integer)
 
-    configuration: Mapped['CatalogConfiguration'] = relationship('CatalogConfiguration', back_populates='catalog_section')
-    module_type: Mapped['ConfiguratorModuletype'] = relationship('ConfiguratorModuletype', back_populates='catalog_section')
+    configuration: Mapped['CatalogConfiguration'] = relationship('CatalogConfiguration', back_populates='catalog_section', lazy=settings.db.lazy)
+    module_type: Mapped['ConfiguratorModuletype'] = relationship('ConfiguratorModuletype', back_populates='catalog_section', lazy=settings.db.lazy)
+
+
+def insert_execution_options(model: type[Base]) -> dict:
+    # Размер пачки multi-row INSERT для таблицы из __table_args__ info.
+    # Опция действует, только если задана на самом выражении или в session.execute
+    page_size = model.__table__.info.get("insertmanyvalues_page_size")
+    return {"insertmanyvalues_page_size": page_size} if page_size else {}
+
+
+# Выражения для самых частых обращений, собираются один раз при импорте.
+# Использование: await session.execute(STMT_BY_ID[CatalogProduct], {"id": pk})
+HOT_MODELS = (
+    AdminSession, AuthUser, CatalogProduct, CatalogCollection, ReferenceEnumentry,
+    CatalogConfiguration, CatalogMediaasset, CatalogSection
+)
+
+STMT_BY_ID = {model: select(model).where(model.id == bindparam("id")) for model in HOT_MODELS}
+STMT_INSERT = {model: insert(model).execution_options(**insert_execution_options(model)) for model in HOT_MODELS}
@@ -1,6 +1,6 @@
 from enum import Enum
 from typing import Optional, ClassVar
-from fastapi import Query
+from fastapi import HTTPException, Query
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends
@@ -31,6 +31,21 @@ class CatalogCollectionSortEnum(str, Enum):
 class CatalogCollectionQueryParamsSortByOrder(BaseModel):
     sort_by: Optional[CatalogCollectionSortEnum] = Query("id", description="Поле для сортировки. Допустимые значения: label, id, defaults.")
     order: Optional[OrderEnum] = Query("asc", description="Направление сортировки: 'asc' (возрастание) или 'desc' (убывание).")
+    limit: int = Query(50, ge=1, le=200, description="Максимальное количество коллекций в ответе.")
+    after_id: Optional[int] = Query(None, description="Курсор: id последней полученной коллекции, только вместе с sort_by=id.")
+
+async def get_collection_query_params(
+    sort_by: CatalogCollectionSortEnum = Query(CatalogCollectionSortEnum.id, description="Поле для сортировки. Допустимые значения: label, id, defaults."),
+    order: OrderEnum = Query(OrderEnum.asc, description="Направление сортировки: 'asc' (возрастание) или 'desc' (убывание)."),
+    limit: int = Query(50, ge=1, le=200, description="Максимальное количество коллекций в ответе."),
+    after_id: Optional[int] = Query(None, description="Курсор: id последней полученной коллекции, только вместе с sort_by=id.")
+) -> CatalogCollectionQueryParamsSortByOrder:
+    # async-зависимость резолвится в event loop, без ухода в threadpool
+    if after_id is not None and sort_by != CatalogCollectionSortEnum.id:
+        #Курсор сравнивается с id, при другой сортировке страницы пропускали бы и повторяли строки
+        raise HTTPException(status_code=422, detail="after_id can only be used with sort_by=id")
+    #Значения уже проверены FastAPI при разборе Query, повторная валидация pydantic не нужна
+    return CatalogCollectionQueryParamsSortByOrder.model_construct(sort_by = sort_by, order = order, limit = limit, after_id = after_id)
 
 class CatalogCollectionQueryParamsSubcategoryId(BaseModel):
 
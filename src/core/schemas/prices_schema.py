@@ -33,12 +33,12 @@ class PriceJsonSchema(BaseSchema):
 
 class PriceJsonSchemaSum(BaseSchema):
     parameters: parameters
-    sum: int
+    sum: float
 
 class PriceJsonSchemaSumWithName(BaseSchema):
     engine: str
     parameters: parameters
-    sum: int
+    sum: float
     
 
 class PriceSchema(BaseSchema):
@@ -7,4 +7,10 @@ from pydantic import BaseModel
 
 class ProductsQueryParamsSubcategoryId(BaseModel):
 
-    subcategory_id: int = Query(description="Фильтрация по подкатегории продукта")
\ No newline at end of file
+    subcategory_id: int = Query(description="Фильтрация по подкатегории продукта")
+
+async def get_products_query_params(
+    subcategory_id: int = Query(description="Фильтрация по подкатегории продукта")
+) -> ProductsQueryParamsSubcategoryId:
+    #Значение уже проверено FastAPI, повторная валидация pydantic не нужна
+    return ProductsQueryParamsSubcategoryId.model_construct(subcategory_id = subcategory_id)
\ No newline at end of file
@@ -4,8 +4,12 @@ from pydantic import ValidationError
 from fastapi.exceptions import ResponseValidationError
 from sqlalchemy.exc import DatabaseError
 from core.utils.logger import logger as log
+import orjson
 
 
+#Тело ответа на ошибку БД не меняется, кодируется один раз при импорте
+DB_ERROR_BODY = orjson.dumps({"message": "An unexpected error has occured."})
+
 
 def register_errors_handlers(app: FastAPI) -> None:
     
@@ -18,7 +22,8 @@ def register_errors_handlers(app: FastAPI) -> None:
             status_code = status.HTTP_422_UNPROCESSABLE_ENTITY,
             content = {
                 "message": "Unhandled error",
-                "error": exc.errors(),
+                #Без url, ctx и input pydantic не собирает ссылки и не копирует входные данные
+                "error": exc.errors(include_url = False, include_context = False, include_input = False),
             }
         )
     
@@ -46,13 +51,12 @@ def register_errors_handlers(app: FastAPI) -> None:
     def handle_db_error(
         request: Request,
         exc: DatabaseError
-    ) -> ORJSONResponse:
+    ) -> Response:
         log.error("Unhandled database error", exc_info = exc)
-        return ORJSONResponse(
+        return Response(
             status_code = status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content = {
-                "message": "An unexpected error has occured."
-            }
+            content = DB_ERROR_BODY,
+            media_type = "application/json"
         )
 
     
\ No newline at end of file
@@ -1,5 +1,7 @@
 import logging
+import sys
 from colorama import Fore, Style
+from core.config import settings
 
 class ColoredFormatter(logging.Formatter):
     COLORS = {
@@ -10,23 +12,32 @@ class ColoredFormatter(logging.Formatter):
         logging.CRITICAL: Fore.RED + Style.BRIGHT
     }
 
+    def __init__(self, fmt = None, datefmt = None, use_color: bool = True):
+        super().__init__(fmt, datefmt)
+        self.use_color = use_color
+
     def format(self, record):
-        if record.levelno in self.COLORS:
-            record.levelname = (f"{self.COLORS[record.levelno]}"
-                              f"{record.levelname}{Style.RESET_ALL}")
-            record.msg = (f"{self.COLORS[record.levelno]}"
-                         f"{record.msg}{Style.RESET_ALL}")
-        return super().format(record)
+        # Цвет оборачивает уже отформатированную строку:
+        # record не меняется и другие обработчики получают его без escape-кодов
+        message = super().format(record)
+        color = self.COLORS.get(record.levelno)
+        if color is None or not self.use_color:
+            return message
+        return f"{color}{message}{Style.RESET_ALL}"
 
 # Настраиваем цветной вывод в консоль
 console_handler = logging.StreamHandler()
 console_handler.setFormatter(ColoredFormatter(
-    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    use_color = sys.stderr.isatty() #В файл или пайп escape-коды не пишем
 ))
 
 # Создаем логгер
 logger = logging.getLogger('my_app')
-logger.setLevel(logging.DEBUG)
+#Записи ниже уровня отбрасываются в logger.debug/info до форматирования
+logger.setLevel(settings.run.log_level.upper())
+#Свой обработчик уже есть, root не должен выводить записи второй раз
+logger.propagate = False
 
 # Добавляем обработчики
-logger.addHandler(console_handler)
\ No newline at end of file
+logger.addHandler(console_handler)
@@ -4,16 +4,23 @@ from api import api_router
 from core.config import settings
 from contextlib import asynccontextmanager
 from core.models import db_helper
+from core.cache.cache_helper import cache_helper
+from core.crud.warmup import warm_statement_cache
 from fastapi.responses import ORJSONResponse
 from core.utils.errors_handlers import register_errors_handlers
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    if settings.db.warmup:
+        async with db_helper.db_helper.session_factory() as session:
+            await warm_statement_cache(session)
     yield
     await db_helper.db_helper.dispose()
+    await cache_helper.dispose()
 
 app = FastAPI(
     root_path="/fastapi",
@@ -24,10 +31,20 @@ app = FastAPI(
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # You can specify domains instead of *
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins = settings.cors.origins,
+    allow_origin_regex = settings.cors.origin_regex,
+    #С "*" в origins браузеру нельзя отдавать credentials, иначе Starlette отражает любой Origin
+    allow_credentials = "*" not in settings.cors.origins,
+    #Явные списки вместо "*": на preflight не нужно отражать запрошенные методы и заголовки
+    allow_methods = settings.cors.methods,
+    allow_headers = settings.cors.headers,
+    expose_headers = settings.cors.expose_headers,
+)
+
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size = settings.run.gzip_minimum_size,
+    compresslevel = settings.run.gzip_compresslevel,
 )
 
 register_errors_handlers(app = app)
@@ -0,0 +1,41 @@
+import asyncio
+import os
+import pytest
+from sqlalchemy import func, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from core.models.bulk import bulk_copy
+from core.models.models import ReferenceUnitofmeasure
+
+
+# Тест пишет в настоящую БД: TEST_DB_URL должен указывать на одноразовую базу
+TEST_DB_URL = os.environ.get("TEST_DB_URL")
+
+pytestmark = pytest.mark.skipif(not TEST_DB_URL, reason="TEST_DB_URL is not set")
+
+
+def test_bulk_copy_rolls_back_with_session():
+    async def run() -> int:
+        engine = create_async_engine(TEST_DB_URL)
+        table = ReferenceUnitofmeasure.__table__
+        async with engine.begin() as connection:
+            created = not await connection.run_sync(lambda sync: inspect(sync).has_table(table.name))
+            if created:
+                await connection.run_sync(table.create)
+        try:
+            rows = [{"id": f"copy-{index}", "precision": index} for index in range(3)]
+            async with AsyncSession(engine) as session:
+                #COPY первым запросом сессии должен попасть в ее транзакцию
+                await bulk_copy(session, ReferenceUnitofmeasure, rows)
+                await session.rollback()
+
+            async with engine.connect() as connection:
+                return await connection.scalar(
+                    select(func.count()).select_from(table).where(table.c.id.like("copy-%"))
+                )
+        finally:
+            if created:
+                async with engine.begin() as connection:
+                    await connection.run_sync(table.drop)
+            await engine.dispose()
+
+    assert asyncio.run(run()) == 0